@@ -19,6 +19,10 @@ def counter() -> MergeFn:
     return merge
 
 
+def _take_theirs(old: Any | None, ours: Any, theirs: Any) -> Any:
+    return theirs
+
+
 def last_writer_wins() -> MergeFn:
     """Last-writer-wins: always returns theirs."""
-    return lambda old, ours, theirs: theirs
+    return _take_theirs
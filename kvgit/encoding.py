@@ -5,19 +5,57 @@ encoding to a deterministic compact form. Centralized here so that
 the on-disk wire format is defined in exactly one place — anyone
 who needs to construct or inspect kvgit storage bytes (including
 tests and tooling) goes through these.
+
+Decoding uses ``orjson`` when it is installed (``pip install
+kvgit[fast]``), falling back to the stdlib for anything orjson rejects
+(``NaN``/``Infinity``, integers beyond 64 bits). Encoding always uses
+the stdlib: storage bytes are hashed, so their exact form must not
+depend on which optional packages happen to be present.
 """
 
 import json
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
+
+# ``json.dumps`` builds a fresh ``JSONEncoder`` on every call that passes
+# non-default options. These are hot (every HAMT node, keyset entry and
+# commit hash goes through them), so reuse prebuilt encoders. Output is
+# byte-identical to the equivalent ``json.dumps`` call.
+_COMPACT = json.JSONEncoder(separators=(",", ":"))
+_CANONICAL = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
+def dumps(obj, *, sort_keys: bool = False) -> bytes:
+    """Serialize a JSON-safe Python object to bytes (compact, deterministic).
+
+    ``sort_keys=True`` gives the canonical form used wherever the bytes
+    are hashed and object key order is not already fixed by the caller.
+    """
+    encoder = _CANONICAL if sort_keys else _COMPACT
+    return encoder.encode(obj).encode()
+
 
-def dumps(obj) -> bytes:
-    """Serialize a JSON-safe Python object to bytes (compact, deterministic)."""
-    return json.dumps(obj, separators=(",", ":")).encode()
+if orjson is not None:
+    _orjson_loads = orjson.loads
+    _orjson_error = orjson.JSONDecodeError
 
+    def loads(raw: bytes):
+        """Deserialize JSON bytes to a Python object."""
+        try:
+            return _orjson_loads(raw)
+        except _orjson_error:
+            # Valid for the stdlib but not orjson (NaN, big ints), or
+            # genuinely malformed, in which case this raises.
+            return json.loads(raw)
 
-def loads(raw: bytes):
-    """Deserialize JSON bytes to a Python object."""
-    return json.loads(raw)
+else:
+
+    def loads(raw: bytes):
+        """Deserialize JSON bytes to a Python object."""
+        return json.loads(raw)
 
 
 def safe_loads(raw: bytes):
@@ -27,6 +65,6 @@ def safe_loads(raw: bytes):
     (corruption, partial writes, version skew).
     """
     try:
-        return json.loads(raw)
+        return loads(raw)
     except Exception:
         return None
@@ -15,10 +15,10 @@ for the kvgit-specific wrapper that adds blob/meta entry semantics.
 
 import base64
 import hashlib
-import json
 from collections.abc import Iterable, Iterator, Mapping
 from typing import NamedTuple
 
+from .encoding import dumps, loads
 from .kv.base import KVStore
 
 # SHA-256 hex digest length. Each nibble is consumed once as the trie
@@ -28,7 +28,7 @@ _HASH_LEN = 64
 
 def _node_bytes(node: dict) -> bytes:
     """Serialize a node deterministically."""
-    return json.dumps(node, sort_keys=True, separators=(",", ":")).encode()
+    return dumps(node, sort_keys=True)
 
 
 def _hash_bytes(b: bytes) -> str:
@@ -121,13 +121,13 @@ class Hamt:
             return {"items": {}, "kind": "leaf"}
         prefixed = self.prefix + node_hash
         if pending is not None and prefixed in pending:
-            return json.loads(pending[prefixed])
+            return loads(pending[prefixed])
         if prefixed in self.pending:
-            return json.loads(self.pending[prefixed])
+            return loads(self.pending[prefixed])
         raw = self.store.get(prefixed)
         if raw is None:
             return None
-        return json.loads(raw)
+        return loads(raw)
 
     def _store_leaf(
         self, encoded_items: Mapping[str, str], pending: dict[str, bytes]
@@ -262,7 +262,7 @@ class Hamt:
                     continue
                 prefixed = self.prefix + node_hash
                 if prefixed in self.pending:
-                    cached_nodes[node_hash] = json.loads(self.pending[prefixed])
+                    cached_nodes[node_hash] = loads(self.pending[prefixed])
                 else:
                     to_fetch.append(prefixed)
 
@@ -284,7 +284,7 @@ class Hamt:
                     raw = fetched.get(self.prefix + node_hash)
                     if raw is None:
                         continue  # missing — skip rather than crash
-                    node = json.loads(raw)
+                    node = loads(raw)
 
                 nodes.add(node_hash)
 
@@ -563,7 +563,7 @@ class Hamt:
                 continue
             node_bytes = pending[prefixed]
             result[prefixed] = node_bytes
-            node = json.loads(node_bytes)
+            node = loads(node_bytes)
             if node["kind"] == "branch":
                 queue.extend(node["children"].values())
         return result
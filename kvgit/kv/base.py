@@ -28,6 +28,10 @@ class KVStore(ABC):
     unpacking incurs at the call boundary.
     """
 
+    # Empty so subclasses may opt into ``__slots__``; ones that don't
+    # still get a ``__dict__`` as usual.
+    __slots__ = ()
+
     @abstractmethod
     def get(self, key: str) -> bytes | None:
         """Get bytes value for key, or None if not found."""
@@ -65,6 +69,15 @@ class KVStore(ABC):
     def keys(self) -> Iterable[str]:
         """Iterate over all keys."""
 
+    def keys_with_prefix(self, prefix: str) -> Iterable[str]:
+        """Iterate over keys that start with ``prefix``.
+
+        The default implementation filters ``keys()``. Backends that can
+        scan a prefix natively (or at least filter without handing every
+        key back to Python one by one) should override it.
+        """
+        return (k for k in self.keys() if isinstance(k, str) and k.startswith(prefix))
+
     @abstractmethod
     def __contains__(self, key: str) -> bool:
         """Check if key exists in store."""
@@ -91,6 +104,24 @@ class KVStore(ABC):
         Returns True if swap succeeded, False otherwise.
         """
 
+    def set_many_and_cas(
+        self,
+        items: Mapping[str, bytes],
+        key: str,
+        value: bytes,
+        expected: bytes | None,
+    ) -> bool:
+        """Write ``items`` unconditionally, then compare-and-swap ``key``.
+
+        The writes land whether or not the swap succeeds. Returns the
+        ``cas`` result. The default issues ``set_many`` then ``cas``;
+        backends with a transaction or pipeline primitive should
+        override it to do both in one round-trip.
+        """
+        if items:
+            self.set_many(items)
+        return self.cas(key, value, expected)
+
     @abstractmethod
     def clear(self) -> None:
         """Remove all items from the store."""
@@ -39,16 +39,43 @@ class Composite(KVStore):
         stores: List of KV stores ordered fastest -> most durable.
     """
 
+    __slots__ = ("_authoritative", "_caches", "_stores", "_upstream")
+
     def __init__(self, stores: list[KVStore]) -> None:
         if not stores:
             raise ValueError("Composite requires at least one store")
         self._stores = stores
+        # Write paths hit the authoritative tier and then fan out to the
+        # cache tiers; split them once instead of slicing per call.
+        self._authoritative = stores[-1]
+        self._caches = stores[:-1]
+        # ``_upstream[i]`` are the tiers a hit at tier ``i`` back-fills.
+        self._upstream = [stores[:i] for i in range(len(stores))]
 
     def _populate_caches(self, upto: int, items: Mapping[str, bytes]) -> None:
         """Best-effort write to faster tiers after a slow-tier hit."""
-        for j in range(upto):
+        for j, store in enumerate(self._upstream[upto]):
+            try:
+                store.set_many(items)
+            except Exception as e:
+                if _is_bug(e):
+                    raise
+                logger.warning("Composite cache populate failed at tier %d: %s", j, e)
+
+    def _backfill(self, hits: Mapping[int, Mapping[str, bytes]]) -> None:
+        """Populate faster tiers after a multi-tier ``get_many``.
+
+        ``hits`` maps a tier index to the values found there. Each
+        faster tier receives everything found below it in a single
+        ``set_many``, rather than one call per slower tier that hit.
+        """
+        pending: Mapping[str, bytes] = {}
+        for j in range(max(hits) - 1, -1, -1):
+            below = hits.get(j + 1)
+            if below:
+                pending = {**pending, **below} if pending else below
             try:
-                self._stores[j].set_many(items)
+                self._stores[j].set_many(pending)
             except Exception as e:
                 if _is_bug(e):
                     raise
@@ -71,7 +98,11 @@ class Composite(KVStore):
 
     def get_many(self, *args) -> Mapping[str, bytes]:
         result: dict[str, bytes] = {}
-        remaining = set(self._normalize_keys(args))
+        # A tuple, not a set: most calls ask for a handful of keys and
+        # are answered in full by L1, where hashing them into a set is
+        # pure overhead. Later tiers only see the keys still missing.
+        remaining: tuple[str, ...] | list[str] = tuple(self._normalize_keys(args))
+        hits: dict[int, Mapping[str, bytes]] = {}
         for i, store in enumerate(self._stores):
             if not remaining:
                 break
@@ -86,10 +117,14 @@ class Composite(KVStore):
                     raise
                 logger.warning("Composite get_many failed at tier %d: %s", i, e)
                 continue
-            if tier_values and i > 0:
-                self._populate_caches(i, tier_values)
+            if not tier_values:
+                continue
+            if i > 0:
+                hits[i] = tier_values
             result.update(tier_values)
-            remaining -= tier_values.keys()
+            remaining = [k for k in remaining if k not in tier_values]
+        if hits:
+            self._backfill(hits)
         return result
 
     def __contains__(self, key: str) -> bool:
@@ -107,16 +142,19 @@ class Composite(KVStore):
         return False
 
     def keys(self) -> Iterable[str]:
-        return self._stores[-1].keys()
+        return self._authoritative.keys()
+
+    def keys_with_prefix(self, prefix: str) -> Iterable[str]:
+        return self._authoritative.keys_with_prefix(prefix)
 
     def items(self) -> Iterable[tuple[str, bytes]]:
-        return self._stores[-1].items()
+        return self._authoritative.items()
 
     def set(self, key: str, value: bytes) -> None:
         # Authoritative tier first; failures here propagate (durability
         # is the contract of set()). Cache-tier failures are logged.
-        self._stores[-1].set(key, value)
-        for i, store in enumerate(self._stores[:-1]):
+        self._authoritative.set(key, value)
+        for i, store in enumerate(self._caches):
             try:
                 store.set(key, value)
             except Exception as e:
@@ -131,8 +169,8 @@ class Composite(KVStore):
         **kwargs: bytes,
     ) -> None:
         items = self._normalize_items(items, kwargs)
-        self._stores[-1].set_many(items)
-        for i, store in enumerate(self._stores[:-1]):
+        self._authoritative.set_many(items)
+        for i, store in enumerate(self._caches):
             try:
                 store.set_many(items)
             except Exception as e:
@@ -141,8 +179,8 @@ class Composite(KVStore):
                 logger.warning("Composite set_many failed at tier %d: %s", i, e)
 
     def remove(self, key: str) -> None:
-        self._stores[-1].remove(key)
-        for i, store in enumerate(self._stores[:-1]):
+        self._authoritative.remove(key)
+        for i, store in enumerate(self._caches):
             try:
                 store.remove(key)
             except Exception as e:
@@ -154,8 +192,8 @@ class Composite(KVStore):
 
     def remove_many(self, *args) -> None:
         keys = list(self._normalize_keys(args))
-        self._stores[-1].remove_many(keys)
-        for i, store in enumerate(self._stores[:-1]):
+        self._authoritative.remove_many(keys)
+        for i, store in enumerate(self._caches):
             try:
                 store.remove_many(keys)
             except Exception as e:
@@ -164,8 +202,8 @@ class Composite(KVStore):
                 logger.warning("Composite remove_many failed at tier %d: %s", i, e)
 
     def clear(self) -> None:
-        self._stores[-1].clear()
-        for i, store in enumerate(self._stores[:-1]):
+        self._authoritative.clear()
+        for i, store in enumerate(self._caches):
             try:
                 store.clear()
             except Exception as e:
@@ -174,9 +212,9 @@ class Composite(KVStore):
                 logger.warning("Composite clear failed at tier %d: %s", i, e)
 
     def cas(self, key: str, value: bytes, expected: bytes | None) -> bool:
-        success = self._stores[-1].cas(key, value, expected)
+        success = self._authoritative.cas(key, value, expected)
         if success:
-            for i, store in enumerate(self._stores[:-1]):
+            for i, store in enumerate(self._caches):
                 try:
                     store.set(key, value)
                 except Exception as e:
@@ -1,7 +1,7 @@
 """In-memory KV store."""
 
 import threading
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 
 from .base import KVStore
 
@@ -9,31 +9,41 @@ from .base import KVStore
 class Memory(KVStore):
     """A memory-backed KV store.
 
-    All operations are protected by a single lock, making this
-    implementation safe for concurrent readers and writers
-    (including free-threaded Python 3.14+).
+    Writers are serialized by a single lock, making this implementation
+    safe for concurrent readers and writers (including free-threaded
+    Python 3.14+). Point reads take no lock: a single ``dict`` lookup is
+    atomic. ``get_many`` reads optimistically under a sequence counter
+    that writers bump before and after each mutation (odd while a write
+    is in flight), retrying under the lock only if a write overlapped,
+    so it never observes half of a ``set_many``.
     """
 
     def __init__(self) -> None:
         self.memory: dict[str, bytes] = {}
         self._lock = threading.Lock()
+        self._seq = 0
 
     def get(self, key: str) -> bytes | None:
-        with self._lock:
-            return self.memory.get(key)
+        return self.memory.get(key)
 
     def set(self, key: str, value: bytes) -> None:
         if not isinstance(value, bytes):
             raise TypeError(f"Expected bytes, got {type(value).__name__}")
         with self._lock:
+            self._seq += 1
             self.memory[key] = value
+            self._seq += 1
 
     def get_many(self, *args) -> Mapping[str, bytes]:
-        keys = self._normalize_keys(args)
+        keys = tuple(self._normalize_keys(args))  # may be read twice
+        memory = self.memory
+        start = self._seq
+        if not start & 1:
+            result = {key: val for key in keys if (val := memory.get(key)) is not None}
+            if self._seq == start:
+                return result
         with self._lock:
-            return {
-                key: val for key in keys if (val := self.memory.get(key)) is not None
-            }
+            return {key: val for key in keys if (val := memory.get(key)) is not None}
 
     def set_many(
         self,
@@ -46,40 +56,89 @@ class Memory(KVStore):
             if not isinstance(value, bytes):
                 raise TypeError(f"Expected bytes for {key}, got {type(value).__name__}")
         with self._lock:
+            self._seq += 1
             self.memory.update(items)
+            self._seq += 1
+
+    def items(self) -> Iterator[tuple[str, bytes]]:
+        """Iterate over pairs, holding the lock only to snapshot keys.
 
-    def items(self) -> Iterable[tuple[str, bytes]]:
+        Values are looked up as the iterator advances, so writers are
+        not stalled for the length of a full scan. Keys removed after
+        the snapshot are skipped; values are immutable ``bytes``.
+        """
         with self._lock:
-            return list(self.memory.items())
+            snapshot = tuple(self.memory)
+        memory = self.memory
+        for key in snapshot:
+            value = memory.get(key)
+            if value is not None:
+                yield key, value
 
     def keys(self) -> Iterable[str]:
         with self._lock:
-            return list(self.memory.keys())
+            return tuple(self.memory)
 
-    def __contains__(self, key: str) -> bool:
+    def keys_with_prefix(self, prefix: str) -> Iterable[str]:
         with self._lock:
-            return key in self.memory
+            return [k for k in self.memory if k.startswith(prefix)]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.memory
 
     def remove(self, key: str) -> None:
         with self._lock:
+            self._seq += 1
             self.memory.pop(key, None)
+            self._seq += 1
 
     def remove_many(self, *args) -> None:
         keys = self._normalize_keys(args)
         with self._lock:
+            self._seq += 1
+            pop = self.memory.pop
             for key in keys:
-                self.memory.pop(key, None)
+                pop(key, None)
+            self._seq += 1
 
     def cas(self, key: str, value: bytes, expected: bytes | None) -> bool:
         if not isinstance(value, bytes):
             raise TypeError(f"Expected bytes, got {type(value).__name__}")
+        # A mismatch seen without the lock is already a valid failure:
+        # the swap is linearized at that read. Only a possible match
+        # needs re-checking under the lock.
+        if self.memory.get(key) != expected:
+            return False
         with self._lock:
             current = self.memory.get(key)
             if current == expected:
+                self._seq += 1
                 self.memory[key] = value
+                self._seq += 1
                 return True
             return False
 
+    def set_many_and_cas(
+        self,
+        items: Mapping[str, bytes],
+        key: str,
+        value: bytes,
+        expected: bytes | None,
+    ) -> bool:
+        for k, v in {**items, key: value}.items():
+            if not isinstance(v, bytes):
+                raise TypeError(f"Expected bytes for {k}, got {type(v).__name__}")
+        with self._lock:
+            self._seq += 1
+            self.memory.update(items)
+            swapped = self.memory.get(key) == expected
+            if swapped:
+                self.memory[key] = value
+            self._seq += 1
+            return swapped
+
     def clear(self) -> None:
         with self._lock:
+            self._seq += 1
             self.memory.clear()
+            self._seq += 1
@@ -17,6 +17,10 @@ class Namespaced(MutableMapping[str, Any]):
         namespace: The namespace name (must not contain ``/``).
     """
 
+    # Views are cheap and created freely (one per sub-namespace), so
+    # skip the per-instance ``__dict__``.
+    __slots__ = ("_prefix", "_store", "namespace")
+
     def __init__(self, store: MutableMapping[str, Any], namespace: str) -> None:
         if "/" in namespace:
             raise ValueError("Namespace names cannot contain '/'")
@@ -32,9 +36,10 @@ class Namespaced(MutableMapping[str, Any]):
         else:
             self.namespace = namespace
             self._store = store
+        self._prefix = f"{self.namespace}/"
 
     def _prefixed(self, key: str) -> str:
-        return f"{self.namespace}/{key}"
+        return self._prefix + key
 
     # -- Read operations --
 
@@ -44,9 +49,13 @@ class Namespaced(MutableMapping[str, Any]):
 
     def get_many(self, *keys: str) -> dict[str, Any]:
         """Get multiple values from the namespaced view."""
-        prefixed = {self._prefixed(k): k for k in keys}
+        # Every returned key carries the same prefix, so strip it by
+        # length instead of keeping a prefixed -> key reverse map.
+        prefix = self._prefix
+        cut = len(prefix)
+        prefixed = [prefix + k for k in keys]
         if hasattr(self._store, "get_many"):
-            result = self._store.get_many(*prefixed.keys())
+            result = self._store.get_many(*prefixed)
         else:
             result = {}
             for k in prefixed:
@@ -54,25 +63,41 @@ class Namespaced(MutableMapping[str, Any]):
                     result[k] = self._store[k]
                 except KeyError:
                     pass
-        return {prefixed[pk]: v for pk, v in result.items()}
+        return {pk[cut:]: v for pk, v in result.items()}
+
+    def _scan(self, prefix: str) -> Iterable[str]:
+        """Underlying keys starting with ``prefix``.
+
+        Pushed down to the wrapped store's ``keys_with_prefix`` when it
+        has one (``Staged``, any ``KVStore``), so enumerating a namespace
+        does not hand every key in the store back to this loop.
+        """
+        keys_with_prefix = getattr(self._store, "keys_with_prefix", None)
+        if keys_with_prefix is not None:
+            return keys_with_prefix(prefix)
+        return (key for key in self._store.keys() if key.startswith(prefix))
+
+    def _iter_children(self) -> Iterator[str]:
+        """Yield direct child keys without collecting them.
+
+        The underlying stores never report a key twice, so the result
+        needs no de-duplication and ``__len__`` can count it directly.
+        """
+        cut = len(self._prefix)
+        for key in self._scan(self._prefix):
+            remainder = key[cut:]
+            if remainder and "/" not in remainder:
+                yield remainder
 
     def keys(self) -> set[str]:  # type: ignore[override]
         """Direct child keys in this namespace (not nested)."""
-        prefix = f"{self.namespace}/"
-        result: set[str] = set()
-        for key in self._store.keys():
-            if key.startswith(prefix):
-                remainder = key[len(prefix) :]
-                if remainder and "/" not in remainder:
-                    result.add(remainder)
-        return result
+        return set(self._iter_children())
 
     def descendant_keys(self) -> Iterable[str]:
         """All keys under this namespace, including nested."""
-        prefix = f"{self.namespace}/"
-        for key in self._store.keys():
-            if key.startswith(prefix):
-                yield key[len(prefix) :]
+        cut = len(self._prefix)
+        for key in self._scan(self._prefix):
+            yield key[cut:]
 
     def __contains__(self, key: object) -> bool:
         if not isinstance(key, str):
@@ -89,7 +114,9 @@ class Namespaced(MutableMapping[str, Any]):
         del self._store[self._prefixed(key)]
 
     def __iter__(self) -> Iterator[str]:
-        return iter(self.keys())
+        # Snapshot (a tuple, so no hashing) so callers may write
+        # through the view while iterating it.
+        return iter(tuple(self._iter_children()))
 
     def __len__(self) -> int:
-        return len(self.keys())
+        return sum(1 for _ in self._iter_children())
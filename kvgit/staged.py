@@ -1,15 +1,23 @@
 """Staged: buffered writes over a Versioned store."""
 
 import inspect
+import itertools
 import pickle
-from collections.abc import Iterable, Iterator, MutableMapping
+from collections import ChainMap, OrderedDict
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping, Sized
 from typing import Any, Callable
 
 from .codecs._hash import hash_bytes
-from .content_types import MergeFn
+from .content_types import MergeFn, _take_theirs
 from .versioned.kv import CHUNK_PREFIX, VersionedKV
 from .versioned.protocol import BytesMergeFn, MergeResult, Versioned
 
+# Default bound on decoded values kept by ``Staged``'s read cache.
+_CACHE_SIZE = 1024
+
+# Sentinel for lookups where ``None`` is a valid stored value.
+_MISSING = object()
+
 
 class _ChunkSink:
     """Accumulates content-addressed chunks emitted during one encode.
@@ -60,6 +68,16 @@ class _ChunkReader:
         return None
 
 
+def _pickle_dumps(value: Any) -> bytes:
+    """Default encoder: ``pickle.dumps`` at the highest protocol.
+
+    Protocol 5 writes large contiguous buffers (``bytes``, numpy arrays)
+    into the pickle without an intermediate copy. ``pickle.loads``
+    detects the protocol, so the default decoder is unchanged.
+    """
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
 def _is_chunk_aware(fn) -> bool:
     """Detect if an encoder/decoder takes a required sink/reader arg.
 
@@ -85,6 +103,38 @@ def _is_chunk_aware(fn) -> bool:
     return len(required) >= 2
 
 
+class _LazyMergeFns(Mapping[str, BytesMergeFn]):
+    """Bytes-level view of user merge fns, wrapped on first lookup.
+
+    A commit only consults the merge fns of keys that actually
+    conflict, so most registered fns never need a wrapper.
+    """
+
+    def __init__(
+        self,
+        fns: Mapping[str, MergeFn],
+        wrap: Callable[[MergeFn], BytesMergeFn],
+    ) -> None:
+        self._fns = fns
+        self._wrap = wrap
+        self._wrapped: dict[str, BytesMergeFn] = {}
+
+    def __getitem__(self, key: str) -> BytesMergeFn:
+        wrapped = self._wrapped.get(key)
+        if wrapped is None:
+            wrapped = self._wrapped[key] = self._wrap(self._fns[key])
+        return wrapped
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._fns
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fns)
+
+    def __len__(self) -> int:
+        return len(self._fns)
+
+
 class Staged(MutableMapping[str, Any]):
     """Buffered write layer over a ``Versioned`` store.
 
@@ -102,15 +152,22 @@ class Staged(MutableMapping[str, Any]):
       ``decoder(bytes, reader) -> value`` enable chunked codecs from
       :mod:`kvgit.codecs`. The first chunked write upgrades the store
       to v3.
+
+    Decoded reads are kept in an LRU cache of up to ``cache_size``
+    values (``0`` disables it), so scanning a large store does not
+    pin every value in memory.
     """
 
     def __init__(
         self,
         versioned: Versioned,
         *,
-        encoder: Callable[..., bytes] = pickle.dumps,
+        encoder: Callable[..., bytes] = _pickle_dumps,
         decoder: Callable[..., Any] = pickle.loads,
+        cache_size: int = _CACHE_SIZE,
     ) -> None:
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be >= 0, got {cache_size}")
         self._versioned = versioned
         self._encoder = encoder
         self._decoder = decoder
@@ -133,7 +190,8 @@ class Staged(MutableMapping[str, Any]):
         )
         self._updates: dict[str, Any] = {}
         self._removals: set[str] = set()
-        self._cache: dict[str, Any] = {}
+        self._cache: OrderedDict[str, Any] = OrderedDict()
+        self._cache_size = cache_size
         self._merge_fns: dict[str, MergeFn] = {}
         self._default_merge: MergeFn | None = None
 
@@ -142,6 +200,12 @@ class Staged(MutableMapping[str, Any]):
             return self._decoder(raw, self._chunk_reader)
         return self._decoder(raw)
 
+    def _cache_put(self, key: str, value: Any) -> None:
+        cache = self._cache
+        cache[key] = value
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+
     # -- Read operations --
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -150,13 +214,15 @@ class Staged(MutableMapping[str, Any]):
             return default
         if key in self._updates:
             return self._updates[key]
-        if key in self._cache:
-            return self._cache[key]
+        cache = self._cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
         raw = self._versioned.get(key)
         if raw is None:
             return default
         value = self._decode(raw)
-        self._cache[key] = value
+        self._cache_put(key, value)
         return value
 
     def get_many(self, *keys: str) -> dict[str, Any]:
@@ -169,54 +235,92 @@ class Staged(MutableMapping[str, Any]):
             if key in self._updates:
                 result[key] = self._updates[key]
             elif key in self._cache:
+                self._cache.move_to_end(key)
                 result[key] = self._cache[key]
             else:
                 fetch.append(key)
         if fetch:
             for key, raw in self._versioned.get_many(*fetch).items():
                 value = self._decode(raw)
-                self._cache[key] = value
+                self._cache_put(key, value)
                 result[key] = value
         return result
 
-    def keys(self) -> set[str]:  # type: ignore[override]
-        """All keys visible in the current state (committed + staged)."""
-        seen: set[str] = set()
+    def keys_with_prefix(self, prefix: str) -> Iterator[str]:
+        """Visible keys starting with ``prefix``, without building ``keys()``.
+
+        Used by ``Namespaced`` to enumerate one namespace without
+        materializing the full committed + staged key set.
+        """
+        removals = self._removals
+        updates = self._updates
         for key in self._versioned.keys():
-            if key not in self._removals:
-                seen.add(key)
-        seen.update(self._updates.keys())
-        return seen
+            if key.startswith(prefix) and key not in removals and key not in updates:
+                yield key
+        for key in updates:
+            if key.startswith(prefix):
+                yield key
 
     def __contains__(self, key: object) -> bool:
         if not isinstance(key, str):
             return False
         if key in self._removals:
             return False
-        if key in self._updates:
+        if key in self._updates or key in self._cache:
             return True
         return key in self._versioned
 
     def __getitem__(self, key: str) -> Any:
-        if key not in self:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
             raise KeyError(key)
-        return self.get(key)
+        return value
 
     def __setitem__(self, key: str, value: Any) -> None:
         self._removals.discard(key)
         self._updates[key] = value
 
     def __delitem__(self, key: str) -> None:
-        if key not in self:
+        if key in self._updates:
+            del self._updates[key]
+            # A key that only exists in the staging buffer needs no
+            # removal record; committing one would be a wasted write.
+            if key in self._versioned:
+                self._removals.add(key)
+            return
+        if key in self._removals or key not in self._versioned:
             raise KeyError(key)
-        self._updates.pop(key, None)
         self._removals.add(key)
 
+    def keys(self) -> set[str]:  # type: ignore[override]
+        """All keys visible in the current state (committed + staged).
+
+        Returns a snapshot ``set``. Membership tests and iteration on
+        the store itself avoid building it.
+        """
+        return set(self)
+
     def __iter__(self) -> Iterator[str]:
-        return iter(self.keys())
+        if not self._updates and not self._removals:
+            return iter(self._versioned.keys())
+        # Snapshot only the staged side (small) so writes during
+        # iteration are safe; the committed keys are never mutated in
+        # place, only replaced on commit.
+        updates = tuple(self._updates)
+        hidden = self._removals | self._updates.keys()
+        committed = (k for k in self._versioned.keys() if k not in hidden)
+        return itertools.chain(committed, updates)
 
     def __len__(self) -> int:
-        return len(self.keys())
+        committed = self._versioned.keys()
+        if isinstance(committed, Sized):
+            n = len(committed)
+        else:
+            n = sum(1 for _ in committed)
+        versioned = self._versioned
+        n += sum(1 for k in self._updates if k not in versioned)
+        n -= sum(1 for k in self._removals if k in versioned)
+        return n
 
     # -- Merge function registry --
 
@@ -232,15 +336,42 @@ class Staged(MutableMapping[str, Any]):
         """Wrap a user-level merge fn into a bytes-level merge fn.
 
         Decoding uses the configured (possibly chunked) decoder so the
-        merge sees real Python values for both sides. Encoding the
-        merge result, however, always falls back to plain ``pickle.dumps``
-        — the bytes-level merge protocol has no place to land chunks
-        (no commit context yet, no sink). Chunked dedup of merge
-        outputs is not supported in v1; merge outputs are stored as
-        opaque blobs. Subsequent commits that overwrite the merged key
-        do go through the chunked path normally.
+        merge sees real Python values for both sides. Plain encoders
+        also encode the merge result. A chunked encoder, however,
+        falls back to plain ``pickle.dumps`` — the bytes-level merge
+        protocol has no place to land chunks (no commit context yet,
+        no sink). Chunked dedup of merge outputs is not supported in
+        v1; merge outputs are stored as opaque blobs. Subsequent
+        commits that overwrite the merged key do go through the
+        chunked path normally.
         """
-        decode = self._decode
+        dumps = _pickle_dumps if self._encoder_chunked else self._encoder
+        if fn is _take_theirs and not self._decoder_chunked:
+            # Their bytes already are the encoded result, so skip the
+            # decode / re-encode round trip. Chunked blobs still take
+            # the general path: a merge output is stored without chunk
+            # references, so it must not reuse their chunked encoding.
+            removed = dumps(None)
+
+            def take_theirs(
+                old: bytes | None, ours: bytes | None, theirs: bytes | None
+            ) -> bytes:
+                return removed if theirs is None else theirs
+
+            return take_theirs
+
+        # Resolve the decoder variant once rather than re-checking it
+        # through ``_decode`` for each of the three inputs per merge.
+        decoder = self._decoder
+        decode: Callable[[bytes], Any]
+        if self._decoder_chunked:
+            reader = self._chunk_reader
+
+            def decode(raw: bytes) -> Any:
+                return decoder(raw, reader)
+
+        else:
+            decode = decoder
 
         def wrapped(
             old: bytes | None, ours: bytes | None, theirs: bytes | None
@@ -248,7 +379,7 @@ class Staged(MutableMapping[str, Any]):
             old_val = decode(old) if old is not None else None
             ours_val = decode(ours) if ours is not None else None
             theirs_val = decode(theirs) if theirs is not None else None
-            return pickle.dumps(fn(old_val, ours_val, theirs_val))
+            return dumps(fn(old_val, ours_val, theirs_val))
 
         return wrapped
 
@@ -315,17 +446,16 @@ class Staged(MutableMapping[str, Any]):
             sink.refs_by_key if (sink is not None and sink.refs_by_key) else None
         )
 
-        # Build effective merge fns and wrap to bytes-level
-        effective_fns = dict(self._merge_fns)
-        if merge_fns:
-            effective_fns.update(merge_fns)
+        # Build effective merge fns; each is wrapped to bytes-level only
+        # if the merge actually consults it.
+        effective_fns: Mapping[str, MergeFn] = (
+            ChainMap(merge_fns, self._merge_fns) if merge_fns else self._merge_fns
+        )
         effective_default = default_merge or self._default_merge
 
-        bytes_merge_fns: dict[str, BytesMergeFn] | None = None
+        bytes_merge_fns: Mapping[str, BytesMergeFn] | None = None
         if effective_fns:
-            bytes_merge_fns = {
-                key: self._wrap_merge_fn(fn) for key, fn in effective_fns.items()
-            }
+            bytes_merge_fns = _LazyMergeFns(effective_fns, self._wrap_merge_fn)
 
         bytes_default: BytesMergeFn | None = None
         if effective_default:
@@ -342,6 +472,18 @@ class Staged(MutableMapping[str, Any]):
             chunk_refs=chunk_refs,
         )
         if result.merged:
+            if result.strategy == "fast_forward":
+                # Nobody else moved HEAD, so only the keys written here
+                # changed; cached values for every other key stay valid.
+                cache = self._cache
+                for k in encoded_updates or ():
+                    cache.pop(k, None)
+                for k in removals or ():
+                    cache.pop(k, None)
+            elif result.strategy != "no_op":
+                # A merge pulls in other writers' changes, so any
+                # cached value may be stale.
+                self._cache.clear()
             if keys is not None:
                 # Only clear the committed keys from staging
                 for k in keys:
@@ -350,9 +492,6 @@ class Staged(MutableMapping[str, Any]):
             else:
                 self._updates.clear()
                 self._removals.clear()
-            # Always clear the full read cache — HEAD moved, so cached
-            # values from other keys may be stale after a merge.
-            self._cache.clear()
         return result
 
     def reset(self) -> None:
@@ -404,6 +543,7 @@ class Staged(MutableMapping[str, Any]):
             self._versioned.create_branch(name, at=at),
             encoder=self._encoder,
             decoder=self._decoder,
+            cache_size=self._cache_size,
         )
 
     def checkout(
@@ -413,7 +553,12 @@ class Staged(MutableMapping[str, Any]):
         v = self._versioned.checkout(commit_hash, branch=branch)
         if v is None:
             return None
-        return Staged(v, encoder=self._encoder, decoder=self._decoder)
+        return Staged(
+            v,
+            encoder=self._encoder,
+            decoder=self._decoder,
+            cache_size=self._cache_size,
+        )
 
     def list_branches(self) -> list[str]:
         """List all branch names in the store."""
@@ -5,7 +5,7 @@ from typing import Any, Callable, Literal
 
 from .kv.base import KVStore
 from .kv.memory import Memory
-from .staged import Staged
+from .staged import Staged, _pickle_dumps
 from .versioned.kv import VersionedKV
 
 
@@ -15,7 +15,7 @@ def store(
     path: str | None = None,
     db_name: str = "kvgit",
     branch: str = "main",
-    encoder: Callable[..., bytes] = pickle.dumps,
+    encoder: Callable[..., bytes] = _pickle_dumps,
     decoder: Callable[..., Any] = pickle.loads,
     codecs: str | None = None,
 ) -> Staged:
@@ -28,11 +28,14 @@ def store(
         db_name: IndexedDB database name (default ``"kvgit"``).
             Only used when ``kind="indexeddb"``.
         branch: Branch name (default ``"main"``).
-        encoder: Value encoder (default ``pickle.dumps``).
+        encoder: Value encoder (default ``pickle.dumps`` at the highest
+            protocol).
         decoder: Value decoder (default ``pickle.loads``).
         codecs: Optional named codec preset. Currently supported:
             ``"scientific"`` — numpy/pandas chunked codecs (requires
-            numpy; install with ``pip install kvgit[scientific]``).
+            numpy; install with ``pip install kvgit[scientific]``);
+            ``"msgpack"`` — msgspec msgpack for JSON-like values
+            (install with ``pip install kvgit[msgpack]``).
             Mutually exclusive with explicit ``encoder`` / ``decoder``.
 
     Returns:
@@ -46,7 +49,7 @@ def store(
             installed.
     """
     if codecs is not None:
-        if encoder is not pickle.dumps or decoder is not pickle.loads:
+        if encoder not in (_pickle_dumps, pickle.dumps) or decoder is not pickle.loads:
             raise ValueError(
                 "codecs= is mutually exclusive with explicit encoder/decoder; "
                 "pass one or the other"
@@ -1,7 +1,8 @@
 """Shared commit/merge orchestration for versioned stores."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from collections import ChainMap
+from typing import Iterable, Mapping
 
 from ..errors import ConcurrencyError, MergeConflict
 from .helpers import diff_keysets, walk_history
@@ -93,7 +94,12 @@ class VersionedBase(ABC):
     ) -> Iterable[str]:
         """Yield the commit chain from newest to oldest."""
         start = commit_hash or self._current_commit
-        yield from walk_history(start, self._load_parents, all_parents=all_parents)
+        yield from walk_history(
+            start,
+            self._load_parents,
+            all_parents=all_parents,
+            parents_many_loader=self._load_parents_many,
+        )
 
     def parents(self, commit_hash: str | None = None) -> tuple[str, ...]:
         """Get the direct parent commit(s) of a commit."""
@@ -108,7 +114,7 @@ class VersionedBase(ABC):
         removals: set[str] | None = None,
         *,
         on_conflict: str = "raise",
-        merge_fns: dict[str, BytesMergeFn] | None = None,
+        merge_fns: Mapping[str, BytesMergeFn] | None = None,
         default_merge: BytesMergeFn | None = None,
         info: dict | None = None,
         chunks: dict[str, bytes] | None = None,
@@ -221,7 +227,7 @@ class VersionedBase(ABC):
         their_head: str,
         *,
         on_conflict: str,
-        merge_fns: dict[str, BytesMergeFn] | None,
+        merge_fns: Mapping[str, BytesMergeFn] | None,
         default_merge: BytesMergeFn | None,
         info: dict | None,
         saved_state: tuple | None = None,
@@ -249,18 +255,23 @@ class VersionedBase(ABC):
         # form (calling self.diff() then self._load_keyset() three
         # more times in resolve_merge) loads each commit twice or
         # three times. For backends with non-trivial per-call
-        # latency, deduping cuts merge round-trips by ~60%.
+        # latency, deduping cuts merge round-trips by ~60%. Our own
+        # keyset is already in memory (``_commit_keys`` always
+        # tracks ``_current_commit``) and is only read below.
         lca_keyset = self._load_keyset(lca)
-        our_keyset = self._load_keyset(self._current_commit)
+        our_keyset = self._commit_keys
         their_keyset = self._load_keyset(their_head)
 
         our_diff = diff_keysets(lca_keyset, our_keyset)
         their_diff = diff_keysets(lca_keyset, their_keyset)
 
-        # Build effective merge function lookup
-        effective_fns = dict(self._merge_fns)
+        # Build effective merge function lookup. A ChainMap only reads
+        # the keys the resolver asks for, so a lazily built
+        # ``merge_fns`` mapping is never forced in full. (It is typed
+        # over MutableMapping, but nothing here writes through it.)
+        effective_fns: Mapping[str, BytesMergeFn] = self._merge_fns
         if merge_fns:
-            effective_fns.update(merge_fns)
+            effective_fns = ChainMap(merge_fns, self._merge_fns)  # type: ignore[arg-type]
         effective_default = default_merge or self._default_merge
 
         # Resolve the merge
@@ -274,6 +285,7 @@ class VersionedBase(ABC):
                 blob_reader=self._read_blob,
                 merge_fns=effective_fns,
                 default_merge=effective_default,
+                blobs_reader=self._read_blobs,
             )
         except MergeConflict:
             if saved_state is not None:
@@ -387,6 +399,16 @@ class VersionedBase(ABC):
     def _load_parents(self, commit_hash: str) -> tuple[str, ...]:
         """Load the parent tuple for a commit."""
 
+    def _load_parents_many(
+        self, commit_hashes: list[str]
+    ) -> dict[str, tuple[str, ...]]:
+        """Load parent tuples for several commits.
+
+        The default loads one at a time. Subclasses with a batched
+        backend read should override it.
+        """
+        return {c: self._load_parents(c) for c in commit_hashes}
+
     @abstractmethod
     def _find_lca(self, commit_a: str, commit_b: str) -> str | None:
         """Find the lowest common ancestor of two commits."""
@@ -394,3 +416,16 @@ class VersionedBase(ABC):
     @abstractmethod
     def _read_blob(self, content_id: str) -> bytes | None:
         """Read a blob by its content identifier."""
+
+    def _read_blobs(self, content_ids: list[str]) -> Mapping[str, bytes]:
+        """Read several blobs; missing ones are omitted.
+
+        The default reads one at a time. Subclasses with a batched
+        backend read should override it.
+        """
+        result: dict[str, bytes] = {}
+        for content_id in content_ids:
+            value = self._read_blob(content_id)
+            if value is not None:
+                result[content_id] = value
+        return result
@@ -17,18 +17,13 @@ def diff_keysets(
     "modified" when present in both keysets but mapped to different
     identifiers.
     """
-    keys_a = set(keyset_a.keys())
-    keys_b = set(keyset_b.keys())
-
-    added = keys_b - keys_a
-    removed = keys_a - keys_b
-    common = keys_a & keys_b
-    modified = frozenset(k for k in common if keyset_a[k] != keyset_b[k])
+    keys_a = keyset_a.keys()
+    keys_b = keyset_b.keys()
 
     return DiffResult(
-        added=frozenset(added),
-        removed=frozenset(removed),
-        modified=modified,
+        added=frozenset(keys_b - keys_a),
+        removed=frozenset(keys_a - keys_b),
+        modified=frozenset(k for k in keys_a & keys_b if keyset_a[k] != keyset_b[k]),
     )
 
 
@@ -37,6 +32,9 @@ def walk_history(
     parent_loader: Callable[[str], tuple[str, ...]],
     *,
     all_parents: bool = False,
+    visited: set[str] | None = None,
+    parents_many_loader: Callable[[list[str]], dict[str, tuple[str, ...]]]
+    | None = None,
 ) -> Iterable[str]:
     """Yield commit hashes from newest to oldest.
 
@@ -46,6 +44,15 @@ def walk_history(
             its parent hashes as a tuple.
         all_parents: If False (default), follow only the first parent
             (linear history).  If True, BFS across all parents.
+        visited: Only with ``all_parents``. A caller-owned seen-set,
+            updated in place. Commits already in it are neither yielded
+            nor walked through, so several walks sharing one set visit
+            each commit once in total.
+        parents_many_loader: Only with ``all_parents``. Batched form of
+            ``parent_loader`` (list of hashes -> ``{hash: parents}``).
+            When given, the BFS advances one generation at a time and
+            loads each generation's parents in a single call. The
+            yield order is the same as the one-at-a-time walk.
     """
     if not all_parents:
         current: str | None = start
@@ -53,8 +60,25 @@ def walk_history(
             yield current
             parents = parent_loader(current)
             current = parents[0] if parents else None
+    elif parents_many_loader is not None:
+        if visited is None:
+            visited = set()
+        frontier = [start]
+        while frontier:
+            layer: list[str] = []
+            for current_hash in frontier:
+                if current_hash in visited:
+                    continue
+                visited.add(current_hash)
+                layer.append(current_hash)
+                yield current_hash
+            if not layer:
+                break
+            parents_of = parents_many_loader(layer)
+            frontier = [p for c in layer for p in parents_of[c] if p not in visited]
     else:
-        visited: set[str] = set()
+        if visited is None:
+            visited = set()
         queue: deque[str] = deque([start])
         while queue:
             current_hash = queue.popleft()
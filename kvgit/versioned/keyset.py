@@ -10,16 +10,16 @@ everything else to ``Hamt``. The HAMT does the structural sharing
 work; the Keyset just gives the API a kvgit-friendly shape.
 """
 
-import json
 from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
 from typing import NamedTuple
 
+from ..encoding import dumps, loads
 from ..hamt import EMPTY_HASH, Hamt
 from ..kv.base import KVStore
 
 
-@dataclass
+@dataclass(slots=True)
 class MetaEntry:
     """Per-key metadata stored alongside a blob pointer in a Keyset.
 
@@ -28,6 +28,9 @@ class MetaEntry:
     "this blob is opaque (e.g. plain pickle) — no chunks to track".
     Stored only when non-empty so v2-format entries stay
     byte-identical and remain readable by older code.
+
+    Slotted: ``VersionedKV`` holds one per key in memory, and dropping
+    the per-instance ``__dict__`` more than halves their footprint.
     """
 
     size: int | None
@@ -35,7 +38,7 @@ class MetaEntry:
     chunks: list[str] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KeysetEntry:
     """One entry in a Keyset: a blob pointer plus its metadata."""
 
@@ -57,12 +60,12 @@ def encode_entry(entry: KeysetEntry) -> bytes:
     meta_dict: dict = {"size": meta.size, "created_at": meta.created_at}
     if meta.chunks:
         meta_dict["chunks"] = list(meta.chunks)
-    return json.dumps([entry.blob, meta_dict], separators=(",", ":")).encode()
+    return dumps([entry.blob, meta_dict])
 
 
 def decode_entry(raw: bytes) -> KeysetEntry:
     """Deserialize bytes back into a KeysetEntry."""
-    blob, meta_dict = json.loads(raw)
+    blob, meta_dict = loads(raw)
     return KeysetEntry(
         blob=blob,
         meta=MetaEntry(
@@ -147,9 +150,12 @@ class Keyset:
         return decode_entry(raw)
 
     def get_blob(self, key: str) -> str | None:
-        """Shortcut: just the blob pointer, no meta."""
-        entry = self.get(key)
-        return None if entry is None else entry.blob
+        """Shortcut: just the blob pointer, no meta.
+
+        Skips building the ``MetaEntry`` that ``get`` would decode.
+        """
+        raw = self._hamt.get(key)
+        return None if raw is None else loads(raw)[0]
 
     def __contains__(self, key: str) -> bool:
         return key in self._hamt
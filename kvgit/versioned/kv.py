@@ -37,16 +37,20 @@ The pre-v2 layout is **not** supported. Stores written by an earlier
 version raise on open and need to be rebuilt fresh.
 """
 
+import gc
 import hashlib
-import json
 import logging
 import time
+from collections import OrderedDict, deque
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
 
 from ..encoding import dumps, loads, safe_loads
 from ..hamt import EMPTY_HASH
 from ..kv.base import KVStore
 from ..kv.memory import Memory
 from .base import VersionedBase
+from .helpers import walk_history
 from .keyset import Keyset, KeysetEntry, MetaEntry
 from .merge import MergeResolution
 
@@ -59,6 +63,16 @@ INFO_KEY = "__info__%s"
 
 CHUNK_PREFIX = "kvgit:chunk:"
 
+# Per-instance LRU bounds for immutable per-commit reads. Parent tuples
+# are tiny; keysets can hold every key in the store, so keep only the
+# two a merge reuses (the merge base and their HEAD).
+_PARENTS_CACHE_SIZE = 1024
+_KEYSET_CACHE_SIZE = 2
+
+# Bare prefixes for scanning the key space by record type.
+_BRANCH_HEAD_PREFIX = BRANCH_HEAD.replace("%s", "")
+_COMMIT_ROOT_PREFIX = COMMIT_ROOT.replace("%s", "")
+
 STORAGE_VERSION_KEY = "__kvgit_version__"
 STORAGE_VERSION = 3
 # Lower versions accepted as input. v3 code reads v2 stores transparently
@@ -66,6 +80,11 @@ STORAGE_VERSION = 3
 SUPPORTED_READ_VERSIONS = frozenset({2, 3})
 
 
+# Update values smaller than this are copied into content_hash's
+# coalescing buffer; larger ones are hashed in place.
+_HASH_COALESCE_MAX = 64 * 1024
+
+
 def content_hash(
     parents: tuple[str, ...],
     keyset: dict[str, str],
@@ -80,22 +99,37 @@ def content_hash(
     (with ``<pending:key>`` markers for not-yet-written blobs), the
     same shape v1 used.
     """
-    h = hashlib.sha256()
-    h.update(json.dumps(list(parents), separators=(",", ":")).encode())
-    h.update(json.dumps(sorted(keyset.items()), separators=(",", ":")).encode())
-    for key in sorted(updates):
-        h.update(key.encode())
-        h.update(updates[key])
+    # Small pieces are coalesced into one buffer so the digest is fed
+    # a few large updates instead of two tiny ones per key; values big
+    # enough to amortize a call are fed directly rather than copied.
+    # The digest is the same as hashing the pieces one by one.
+    h = hashlib.sha256(usedforsecurity=False)
+    buf = bytearray(dumps(list(parents)))
+    buf += dumps(sorted(keyset.items()))
+    for key, value in sorted(updates.items()):
+        buf += key.encode()
+        if len(value) < _HASH_COALESCE_MAX:
+            buf += value
+        else:
+            h.update(buf)
+            buf.clear()
+            h.update(value)
     if info is not None:
-        h.update(json.dumps(info, sort_keys=True, separators=(",", ":")).encode())
+        buf += dumps(info, sort_keys=True)
+    h.update(buf)
     return h.hexdigest()[:40]
 
 
 logger = logging.getLogger("kvgit")
 
+# Fixed values written whenever a fresh branch history is started.
+_INITIAL_COMMIT = content_hash((), {}, {})
+_EMPTY_ROOT_BYTES = dumps(EMPTY_HASH)
+_NO_PARENTS_BYTES = dumps([])
 
-def _check_storage_version(store: KVStore) -> None:
-    """Verify the store's kvgit version is compatible.
+
+def _check_storage_version(store: KVStore) -> int:
+    """Verify the store's kvgit version is compatible and return it.
 
     Stamps the version on a fresh store. Accepts any version listed in
     :data:`SUPPORTED_READ_VERSIONS`; the on-disk stamp is left
@@ -113,13 +147,10 @@ def _check_storage_version(store: KVStore) -> None:
                 f"this code supports {sorted(SUPPORTED_READ_VERSIONS)}. "
                 "Use a fresh store."
             )
-        return
+        return version
 
     # No version sentinel. Either fresh, or pre-v2.
-    branch_prefix = BRANCH_HEAD.replace("%s", "")
-    has_existing = any(
-        isinstance(k, str) and k.startswith(branch_prefix) for k in store.keys()
-    )
+    has_existing = any(True for _ in store.keys_with_prefix(_BRANCH_HEAD_PREFIX))
     if has_existing:
         raise ValueError(
             "Store appears to use an older kvgit storage format. "
@@ -127,6 +158,32 @@ def _check_storage_version(store: KVStore) -> None:
             "or higher. Use a fresh store."
         )
     store.set(STORAGE_VERSION_KEY, dumps(STORAGE_VERSION))
+    return STORAGE_VERSION
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Suspend the cyclic garbage collector around in-memory bulk work.
+
+    Building the keyset dicts for a large commit allocates many
+    containers in a burst, none of which form cycles. Left on, the
+    collector runs repeatedly mid-burst and rescans every long-lived
+    object each time it reaches generation 2. Reference counting still
+    frees everything.
+
+    The collector switch is process-wide, so other threads lose cyclic
+    collection while this is held. Keep the block free of store I/O so
+    the pause stays short. The collector is re-enabled on exit only if
+    this call disabled it.
+    """
+    was_enabled = gc.isenabled()
+    if was_enabled:
+        gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
 
 
 def _load_root(store: KVStore, commit_hash: str) -> str | None:
@@ -138,22 +195,32 @@ def _load_root(store: KVStore, commit_hash: str) -> str | None:
     return val if isinstance(val, str) else None
 
 
-def _resolve_head(store: KVStore, branch: str, *, repair: bool = True) -> str | None:
+def _resolve_head(
+    store: KVStore,
+    branch: str,
+    *,
+    repair: bool = True,
+    trusted: str | None = None,
+) -> str | None:
     """Resolve a branch HEAD, falling back to prev HEAD or commit scan.
 
     When *repair* is True (default), a corrupt HEAD is automatically
     healed by writing the recovered commit hash back to the store.
     Pass ``repair=False`` for side-effect-free reads (e.g. properties).
 
+    *trusted* names a commit the caller already knows exists (one it
+    loaded or wrote itself). When HEAD still points at it, the
+    ``__commit_root__`` existence check is skipped, saving a point
+    read on the steady-state commit path.
+
     Returns a valid commit hash, or None if unrecoverable.
     """
     # 1. Try current HEAD
     head_bytes = store.get(BRANCH_HEAD % branch)
     if head_bytes is not None:
         commit_hash = safe_loads(head_bytes)
-        if (
-            isinstance(commit_hash, str)
-            and store.get(COMMIT_ROOT % commit_hash) is not None
+        if isinstance(commit_hash, str) and (
+            commit_hash == trusted or store.get(COMMIT_ROOT % commit_hash) is not None
         ):
             return commit_hash
 
@@ -192,7 +259,7 @@ def _scan_for_best_commit(store: KVStore, branch: str) -> str | None:
     Finds all valid commits, excludes those reachable from healthy branches,
     and returns the most recent tip (by ``__commit_time__``).
     """
-    root_prefix = COMMIT_ROOT.replace("%s", "")
+    root_prefix = _COMMIT_ROOT_PREFIX
     all_commits: dict[str, float] = {}
     for key in store.keys():
         if not isinstance(key, str) or not key.startswith(root_prefix):
@@ -216,10 +283,8 @@ def _scan_for_best_commit(store: KVStore, branch: str) -> str | None:
 
     # Exclude commits reachable from healthy branches
     claimed: set[str] = set()
-    head_prefix = BRANCH_HEAD.replace("%s", "")
-    for key in store.keys():
-        if not isinstance(key, str) or not key.startswith(head_prefix):
-            continue
+    head_prefix = _BRANCH_HEAD_PREFIX
+    for key in store.keys_with_prefix(head_prefix):
         other = key[len(head_prefix) :]
         if other == branch or not other:
             continue
@@ -286,7 +351,9 @@ class VersionedKV(VersionedBase):
             store = Memory()
         self.store = store
 
-        _check_storage_version(store)
+        # Stamps only ever move forward, so once this instance knows the
+        # store is v3 it never has to re-read the sentinel.
+        self._v3_stamped = _check_storage_version(store) == STORAGE_VERSION
 
         if commit_hash is None:
             commit_hash = _resolve_head(store, branch)
@@ -294,10 +361,10 @@ class VersionedKV(VersionedBase):
                 raise ValueError(f"Branch '{branch}' HEAD is corrupt and unrecoverable")
             if commit_hash is None:
                 # Create initial empty commit
-                commit_hash = content_hash((), {}, {})
+                commit_hash = _INITIAL_COMMIT
                 initial = {
-                    COMMIT_ROOT % commit_hash: dumps(EMPTY_HASH),
-                    PARENT_COMMIT % commit_hash: dumps([]),
+                    COMMIT_ROOT % commit_hash: _EMPTY_ROOT_BYTES,
+                    PARENT_COMMIT % commit_hash: _NO_PARENTS_BYTES,
                     COMMIT_TIME % commit_hash: dumps(time.time()),
                     BRANCH_HEAD % branch: dumps(commit_hash),
                 }
@@ -308,12 +375,42 @@ class VersionedKV(VersionedBase):
                 f"commit_hash must be str, got {type(commit_hash).__name__}"
             )
 
+        self._init_at(commit_hash, branch)
+
+    def _init_at(self, commit_hash: str, branch: str) -> None:
+        """Set up per-instance state and load ``commit_hash``."""
         super().__init__(branch=branch, commit_hash=commit_hash)
 
+        # Last commit known to exist in the store (loaded or CAS'd by
+        # this instance). Lets ``latest_head`` skip re-validating it.
+        self._verified_head: str | None = None
+
+        # Commits are content-addressed and immutable, so their parents
+        # and keysets can be cached by hash without invalidation (other
+        # than dropping entries for commits that ``clean_orphans``
+        # deletes). Merges and LCA searches re-read the same recent
+        # history repeatedly.
+        self._parents_cache: OrderedDict[str, tuple[str, ...]] = OrderedDict()
+        self._keyset_cache: OrderedDict[
+            str, tuple[dict[str, str], dict[str, MetaEntry]]
+        ] = OrderedDict()
+
         # Materialize keyset + meta from the HAMT
         self._meta: dict[str, MetaEntry] = {}
         self._populate_state(commit_hash)
 
+    def _spawn(self, commit_hash: str, branch: str) -> "VersionedKV":
+        """Open another instance on this store at a known-good commit.
+
+        Skips the storage-version read and argument checks ``__init__``
+        does; this instance already passed them on the same store.
+        """
+        other = type(self).__new__(type(self))
+        other.store = self.store
+        other._v3_stamped = self._v3_stamped
+        other._init_at(commit_hash, branch)
+        return other
+
     def _populate_state(self, commit_hash: str) -> None:
         """Walk the commit's HAMT and populate ``_commit_keys`` / ``_meta``.
 
@@ -327,15 +424,20 @@ class VersionedKV(VersionedBase):
             self._commit_keys = {}
             self._meta = {}
             return
+        self._verified_head = commit_hash
 
         materialized = Keyset(self.store, root=root).materialize()
-        self._commit_keys = {k: e.blob for k, e in materialized.items()}
-        self._meta = {k: e.meta for k, e in materialized.items()}
+        with _gc_paused():
+            # Key order lets ``_create_commit`` re-sort cheaply; see there.
+            self._commit_keys = {k: materialized[k].blob for k in sorted(materialized)}
+            self._meta = {k: e.meta for k, e in materialized.items()}
 
     @property
     def latest_head(self) -> str | None:
         """Read HEAD directly from the KV store (reflects other writers)."""
-        return _resolve_head(self.store, self._branch, repair=False)
+        return _resolve_head(
+            self.store, self._branch, repair=False, trusted=self._verified_head
+        )
 
     # -- Read operations --
 
@@ -364,12 +466,12 @@ class VersionedKV(VersionedBase):
     # -- Abstract method implementations --
 
     def _snapshot_state(self) -> tuple:
-        """Capture in-memory state before a commit attempt."""
-        return (
-            self._current_commit,
-            dict(self._commit_keys),
-            dict(self._meta),
-        )
+        """Capture in-memory state before a commit attempt.
+
+        ``_commit_keys`` and ``_meta`` are only ever rebound to fresh
+        dicts, never mutated in place, so holding references is enough.
+        """
+        return (self._current_commit, self._commit_keys, self._meta)
 
     def _restore_state(self, saved: tuple) -> None:
         """Restore in-memory state after a failed commit attempt."""
@@ -394,42 +496,46 @@ class VersionedKV(VersionedBase):
         updates = updates or {}
         removals = removals or set()
         chunks = chunks or {}
-        chunk_refs = chunk_refs or {}
 
         # Build new in-memory dicts: carry forward, apply removals, apply updates
-        new_commit_keys: dict[str, str] = {}
+        carried: dict[str, str] = {}
         new_meta: dict[str, MetaEntry] = {}
 
         for key, versioned_key in self._commit_keys.items():
             if key in removals:
                 continue
-            new_commit_keys[key] = versioned_key
+            carried[key] = versioned_key
             if key in self._meta:
                 new_meta[key] = self._meta[key]
 
         # Compute content-addressable hash from a placeholder keyset
         # (real versioned blob keys depend on the commit hash itself).
-        preview_keys = dict(new_commit_keys)
+        # ``_commit_keys`` is kept in key order, so ``carried`` is one
+        # sorted run plus any new keys appended at the end: re-sorting
+        # it costs O(N + k log k) rather than a full O(N log N) sort,
+        # and ``content_hash``'s own sort then sees a single run.
         for key in updates:
-            preview_keys[key] = f"<pending:{key}>"
+            carried[key] = f"<pending:{key}>"
+        new_commit_keys = dict(sorted(carried.items()))
         new_hash = content_hash(
-            (self._current_commit,), preview_keys, updates, info=info
+            (self._current_commit,), new_commit_keys, updates, info=info
         )
 
         # Resolve real versioned blob keys for new updates
         diffs: dict[str, bytes] = {}
+        blob_prefix = f"{new_hash}:"
+        now = time.time()
+        get_meta = new_meta.get
         for key, value in updates.items():
-            versioned_key = f"{new_hash}:{key}"
+            versioned_key = blob_prefix + key
             diffs[versioned_key] = value
             new_commit_keys[key] = versioned_key
-            size = len(value)
-            refs = chunk_refs.get(key)
-            refs_list = list(refs) if refs else None
-            created_at = new_meta[key].created_at if key in new_meta else time.time()
+            refs = chunk_refs.get(key) if chunk_refs else None
+            prev = get_meta(key)
             new_meta[key] = MetaEntry(
-                size=size,
-                created_at=created_at,
-                chunks=refs_list,
+                size=len(value),
+                created_at=now if prev is None else prev.created_at,
+                chunks=list(refs) if refs else None,
             )
 
         # Stage chunk writes under their content-addressed namespace.
@@ -456,7 +562,7 @@ class VersionedKV(VersionedBase):
         # Commit metadata
         diffs[COMMIT_ROOT % new_hash] = dumps(new_ks.root)
         diffs[PARENT_COMMIT % new_hash] = dumps([self._current_commit])
-        diffs[COMMIT_TIME % new_hash] = dumps(time.time())
+        diffs[COMMIT_TIME % new_hash] = dumps(now)
         if info is not None:
             diffs[INFO_KEY % new_hash] = dumps(info)
 
@@ -478,10 +584,13 @@ class VersionedKV(VersionedBase):
         upgraded, the store can no longer be opened by code that
         only knows v2.
         """
+        if self._v3_stamped:
+            return
         raw = self.store.get(STORAGE_VERSION_KEY)
         current = safe_loads(raw) if raw is not None else None
         if current != STORAGE_VERSION:
             self.store.set(STORAGE_VERSION_KEY, dumps(STORAGE_VERSION))
+        self._v3_stamped = True
 
     def _create_merge_commit(
         self,
@@ -501,27 +610,24 @@ class VersionedKV(VersionedBase):
 
         # Build write batch
         diffs: dict[str, bytes] = {}
+        blob_prefix = f"{merge_hash}:"
         for key, value in merged_values.items():
-            vk = f"{merge_hash}:{key}"
+            vk = blob_prefix + key
             merged_keyset[key] = vk
             diffs[vk] = value
 
         # Build merged meta from the parents' meta. ``self._meta`` is
         # already our parent's meta (in memory). Their parent's meta
-        # we have to walk via the HAMT.
-        their_root = _load_root(self.store, parents[0])
-        their_meta: dict[str, MetaEntry] = {}
-        if their_root is not None:
-            their_ks = Keyset(self.store, root=their_root)
-            for key, entry in their_ks.items():
-                their_meta[key] = entry.meta
+        # comes from the same cached walk the merge diff used.
+        their_meta = self._load_keyset_and_meta(parents[0])[1]
 
         merged_meta: dict[str, MetaEntry] = {}
+        now = time.time()
         for key in merged_keyset:
             if key in merged_values:
                 merged_meta[key] = MetaEntry(
                     size=len(merged_values[key]),
-                    created_at=time.time(),
+                    created_at=now,
                 )
             elif key in self._meta:
                 merged_meta[key] = self._meta[key]
@@ -551,14 +657,14 @@ class VersionedKV(VersionedBase):
 
         diffs[COMMIT_ROOT % merge_hash] = dumps(new_ks.root)
         diffs[PARENT_COMMIT % merge_hash] = dumps(list(parents))
-        diffs[COMMIT_TIME % merge_hash] = dumps(time.time())
+        diffs[COMMIT_TIME % merge_hash] = dumps(now)
         if info is not None:
             diffs[INFO_KEY % merge_hash] = dumps(info)
 
         self.store.set_many(diffs)
 
         # Update in-memory state
-        self._commit_keys = merged_keyset
+        self._commit_keys = dict(sorted(merged_keyset.items()))
         self._current_commit = merge_hash
         self._meta = merged_meta
 
@@ -572,50 +678,137 @@ class VersionedKV(VersionedBase):
         """
         branch_key = BRANCH_HEAD % self._branch
         prev_key = BRANCH_HEAD_PREV % self._branch
-        self.store.set(prev_key, dumps(expected))
-        return self.store.cas(branch_key, dumps(new_head), expected=dumps(expected))
+        expected_bytes = dumps(expected)
+        if self.store.set_many_and_cas(
+            {prev_key: expected_bytes}, branch_key, dumps(new_head), expected_bytes
+        ):
+            self._verified_head = new_head
+            return True
+        return False
 
     def _load_keyset(self, commit_hash: str) -> dict[str, str]:
         """Load just the keyset for a commit (key -> versioned_key mapping).
 
         Used by the merge layer; returns a flat dict, dropping meta.
+        The result may be shared with the cache and must not be mutated.
         """
+        return self._load_keyset_and_meta(commit_hash)[0]
+
+    def _load_keyset_and_meta(
+        self, commit_hash: str
+    ) -> tuple[dict[str, str], dict[str, MetaEntry]]:
+        """Load a commit's keyset and per-key meta with one HAMT walk.
+
+        Both are cached together, so a merge that diffs against their
+        HEAD can reuse the same walk for their meta.
+        """
+        cache = self._keyset_cache
+        cached = cache.get(commit_hash)
+        if cached is not None:
+            cache.move_to_end(commit_hash)
+            return cached
         root = _load_root(self.store, commit_hash)
         if root is None:
-            return {}
-        ks = Keyset(self.store, root=root)
-        return {key: entry.blob for key, entry in ks.items()}
+            return {}, {}
+        entries = Keyset(self.store, root=root).materialize()
+        loaded = (
+            {key: entry.blob for key, entry in entries.items()},
+            {key: entry.meta for key, entry in entries.items()},
+        )
+        cache[commit_hash] = loaded
+        if len(cache) > _KEYSET_CACHE_SIZE:
+            cache.popitem(last=False)
+        return loaded
 
     def _load_parents(self, commit_hash: str) -> tuple[str, ...]:
         """Load the parent tuple for a commit."""
+        cache = self._parents_cache
+        cached = cache.get(commit_hash)
+        if cached is not None:
+            cache.move_to_end(commit_hash)
+            return cached
         parent_bytes = self.store.get(PARENT_COMMIT % commit_hash)
         if parent_bytes is None:
             return ()
+        return self._cache_parents(commit_hash, parent_bytes)
+
+    def _load_parents_many(
+        self, commit_hashes: list[str]
+    ) -> dict[str, tuple[str, ...]]:
+        """Load parent tuples for several commits, fetching misses in one call."""
+        cache = self._parents_cache
+        found: dict[str, tuple[str, ...]] = {}
+        missing: list[str] = []
+        for commit_hash in commit_hashes:
+            cached = cache.get(commit_hash)
+            if cached is not None:
+                cache.move_to_end(commit_hash)
+                found[commit_hash] = cached
+            else:
+                missing.append(commit_hash)
+        if missing:
+            parent_keys = {c: PARENT_COMMIT % c for c in missing}
+            raw = self.store.get_many(*parent_keys.values())
+            for commit_hash, parent_key in parent_keys.items():
+                parent_bytes = raw.get(parent_key)
+                found[commit_hash] = (
+                    ()
+                    if parent_bytes is None
+                    else self._cache_parents(commit_hash, parent_bytes)
+                )
+        return found
+
+    def _cache_parents(self, commit_hash: str, parent_bytes: bytes) -> tuple[str, ...]:
+        """Decode a stored parent pointer and remember it."""
+        # Decoded JSON is exactly a list, a str (legacy single parent)
+        # or None, so exact type checks suffice.
         raw = loads(parent_bytes)
-        if raw is None:
-            return ()
-        if isinstance(raw, str):
-            return (raw,)
-        return tuple(raw)
+        if type(raw) is list:
+            parents: tuple[str, ...] = tuple(raw)
+        elif type(raw) is str:
+            parents = (raw,)
+        else:
+            parents = ()
+        cache = self._parents_cache
+        cache[commit_hash] = parents
+        if len(cache) > _PARENTS_CACHE_SIZE:
+            cache.popitem(last=False)
+        return parents
 
     def _find_lca(self, commit_a: str, commit_b: str) -> str | None:
-        """Find the lowest common ancestor of two commits."""
+        """Find the lowest common ancestor of two commits.
+
+        Bidirectional BFS that pops one commit per side in turn and
+        stops at the first commit seen from both sides. Which commit
+        that is decides the merge base in criss-cross histories, so
+        the visit order is fixed. Parent pointers are still fetched in
+        bulk: when a popped commit's parents aren't loaded yet, the
+        parents of every commit queued on either side are read in one
+        ``get_many``, which is roughly one read per BFS generation.
+        """
         if commit_a == commit_b:
             return commit_a
 
-        from collections import deque
-
         seen_a: set[str] = {commit_a}
         seen_b: set[str] = {commit_b}
         queue_a: deque[str] = deque([commit_a])
         queue_b: deque[str] = deque([commit_b])
+        parents: dict[str, tuple[str, ...]] = {}
+
+        def parents_of(current: str) -> tuple[str, ...]:
+            if current not in parents:
+                fetch = [current]
+                fetch.extend(c for c in queue_a if c not in parents)
+                fetch.extend(c for c in queue_b if c not in parents)
+                parents.update(self._load_parents_many(fetch))
+            return parents[current]
 
         while queue_a or queue_b:
             if queue_a:
                 current = queue_a.popleft()
                 if current in seen_b:
                     return current
-                for p in self._load_parents(current):
+                for p in parents_of(current):
                     if p not in seen_a:
                         seen_a.add(p)
                         queue_a.append(p)
@@ -626,7 +819,7 @@ class VersionedKV(VersionedBase):
                 current = queue_b.popleft()
                 if current in seen_a:
                     return current
-                for p in self._load_parents(current):
+                for p in parents_of(current):
                     if p not in seen_b:
                         seen_b.add(p)
                         queue_b.append(p)
@@ -639,6 +832,10 @@ class VersionedKV(VersionedBase):
         """Read a blob by its versioned key."""
         return self.store.get(content_id)
 
+    def _read_blobs(self, content_ids: list[str]) -> Mapping[str, bytes]:
+        """Read several blobs by versioned key in one store round-trip."""
+        return self.store.get_many(*content_ids)
+
     # -- Navigation --
 
     def refresh(self) -> None:
@@ -654,11 +851,7 @@ class VersionedKV(VersionedBase):
         """Return a new VersionedKV at a specific commit."""
         if self.store.get(COMMIT_ROOT % commit_hash) is None:
             return None
-        return VersionedKV(
-            self.store,
-            commit_hash=commit_hash,
-            branch=branch or self._branch,
-        )
+        return self._spawn(commit_hash, branch or self._branch)
 
     def create_branch(self, name: str, *, at: str | None = None) -> "VersionedKV":
         """Fork a commit onto a new branch.
@@ -671,7 +864,7 @@ class VersionedKV(VersionedBase):
             raise ValueError(f"Commit '{at}' does not exist")
         if not self.store.cas(branch_key, dumps(target), expected=None):
             raise ValueError(f"Branch '{name}' already exists")
-        return VersionedKV(self.store, commit_hash=target, branch=name)
+        return self._spawn(target, name)
 
     def delete_branch(self, name: str) -> None:
         """Delete a branch and clean up orphaned commits."""
@@ -701,11 +894,10 @@ class VersionedKV(VersionedBase):
         root = _load_root(self.store, commit_hash)
         if root is None:
             return None
-        ks = Keyset(self.store, root=root)
-        entry = ks.get(key)
-        if entry is None:
+        blob = Keyset(self.store, root=root).get_blob(key)
+        if blob is None:
             return None
-        return self.store.get(entry.blob)
+        return self.store.get(blob)
 
     def reset_to(self, commit_hash: str) -> bool:
         """Reset HEAD to a specific commit."""
@@ -724,14 +916,12 @@ class VersionedKV(VersionedBase):
     @staticmethod
     def branches(store: KVStore) -> list[str]:
         """List all branch names in the store."""
-        prefix = BRANCH_HEAD.replace("%s", "")
-        result = []
-        for key in store.keys():
-            if isinstance(key, str) and key.startswith(prefix):
-                branch_name = key[len(prefix) :]
-                if branch_name:
-                    result.append(branch_name)
-        return sorted(result)
+        cut = len(_BRANCH_HEAD_PREFIX)
+        return sorted(
+            key[cut:]
+            for key in store.keys_with_prefix(_BRANCH_HEAD_PREFIX)
+            if len(key) > cut
+        )
 
     def list_branches(self) -> list[str]:
         """List all branch names in the store."""
@@ -764,6 +954,31 @@ class VersionedKV(VersionedBase):
         gc_logger = logging.getLogger("kvgit.orphans")
         cutoff_time = time.time() - min_age
 
+        # Partition the key space in a single pass. The sweep needs four
+        # prefixed subsets (branch heads, commit roots, HAMT nodes,
+        # chunks); scanning ``store.keys()`` once per subset made GC cost
+        # a multiple of the total key count. Snapshotting up front also
+        # means nodes and chunks written by a concurrent writer after
+        # this point are never considered for removal.
+        branch_prefix = _BRANCH_HEAD_PREFIX
+        root_prefix = _COMMIT_ROOT_PREFIX
+        keyset_prefix = Keyset.DEFAULT_PREFIX
+        branch_names: list[str] = []
+        commit_hashes: list[str] = []
+        node_keys: list[str] = []
+        chunk_keys: list[str] = []
+        for key in self.store.keys():
+            if not isinstance(key, str):
+                continue
+            if key.startswith(keyset_prefix):
+                node_keys.append(key)
+            elif key.startswith(CHUNK_PREFIX):
+                chunk_keys.append(key)
+            elif key.startswith(root_prefix):
+                commit_hashes.append(key[len(root_prefix) :])
+            elif key.startswith(branch_prefix):
+                branch_names.append(key[len(branch_prefix) :])
+
         # Mark phase: walk every branch's history, collecting reachable
         # commits, blob keys, HAMT node hashes, and chunk references.
         reachable_commits: set[str] = set()
@@ -790,37 +1005,40 @@ class VersionedKV(VersionedBase):
                     reachable_chunks.update(entry.meta.chunks)
             reachable_nodes.update(new_nodes)
 
-        branch_prefix = BRANCH_HEAD.replace("%s", "")
-        for key in self.store.keys():
-            if not (isinstance(key, str) and key.startswith(branch_prefix)):
-                continue
-            branch_name = key[len(branch_prefix) :]
+        # Branches share one seen-set, so history common to several
+        # branches is walked once rather than once per branch.
+        for branch_name in branch_names:
             branch_head = _resolve_head(self.store, branch_name)
             if branch_head is None:
                 continue
-            for commit in self.history(commit_hash=branch_head, all_parents=True):
-                if commit in reachable_commits:
-                    continue
-                reachable_commits.add(commit)
+            for commit in walk_history(
+                branch_head,
+                self._load_parents,
+                all_parents=True,
+                visited=reachable_commits,
+                parents_many_loader=self._load_parents_many,
+            ):
                 _walk_commit_for_marks(commit)
 
-        # Sweep phase: find orphaned commits via __commit_root__ scan.
-        # Also identify "young orphans" — commits inside the min_age
+        # Sweep phase: find orphaned commits among the __commit_root__
+        # keys. Also identify "young orphans" — commits inside the min_age
         # window that aren't branch-reachable. Their chunks must be
         # protected from sweeping (they may be in-flight from another
         # writer), even though we won't delete the commits themselves
         # until they age past the cutoff.
         orphans: list[str] = []
         young_orphan_commits: list[str] = []
-        root_prefix = COMMIT_ROOT.replace("%s", "")
 
-        for key in self.store.keys():
-            if not (isinstance(key, str) and key.startswith(root_prefix)):
-                continue
-            commit_hash = key[len(root_prefix) :]
-            if not commit_hash or commit_hash in reachable_commits:
-                continue
-            time_bytes = self.store.get(COMMIT_TIME % commit_hash)
+        candidates = [h for h in commit_hashes if h and h not in reachable_commits]
+        # One batched read for every candidate's timestamp instead of a
+        # point read per unreachable commit.
+        commit_times = (
+            self.store.get_many(*[COMMIT_TIME % h for h in candidates])
+            if candidates
+            else {}
+        )
+        for commit_hash in candidates:
+            time_bytes = commit_times.get(COMMIT_TIME % commit_hash)
             if time_bytes is None:
                 # No timestamp recorded — be conservative, leave it alone.
                 continue
@@ -844,12 +1062,22 @@ class VersionedKV(VersionedBase):
         # at the store level (defends against partial sweeps under crash).
         all_removals: list[str] = []
 
-        for orphan_hash in orphans:
-            orphan_root = _load_root(self.store, orphan_hash)
-            if orphan_root is not None and orphan_root != EMPTY_HASH:
+        # One batched read for every orphan's keyset root. Walks skip
+        # subtrees already seen, either under a live commit (whose blobs
+        # are all reachable) or under an earlier orphan (whose blobs are
+        # already queued), so orphans sharing structure are read once.
+        root_keys = {h: COMMIT_ROOT % h for h in orphans}
+        orphan_roots = self.store.get_many(*root_keys.values()) if orphans else {}
+        seen_nodes = set(reachable_nodes)
+        for orphan_hash, root_key in root_keys.items():
+            raw_root = orphan_roots.get(root_key)
+            orphan_root = safe_loads(raw_root) if raw_root is not None else None
+            if isinstance(orphan_root, str) and orphan_root != EMPTY_HASH:
                 try:
-                    # Batched walk for the orphan's blob references.
-                    orphan_entries = Keyset(self.store, root=orphan_root).materialize()
+                    orphan_entries, orphan_nodes = Keyset(
+                        self.store, root=orphan_root
+                    ).walk(skip_nodes=seen_nodes)
+                    seen_nodes.update(orphan_nodes)
                     for entry in orphan_entries.values():
                         if entry.blob not in reachable_blobs:
                             all_removals.append(entry.blob)
@@ -860,7 +1088,7 @@ class VersionedKV(VersionedBase):
                     pass
             all_removals.extend(
                 [
-                    COMMIT_ROOT % orphan_hash,
+                    root_key,
                     PARENT_COMMIT % orphan_hash,
                     COMMIT_TIME % orphan_hash,
                     INFO_KEY % orphan_hash,
@@ -868,19 +1096,14 @@ class VersionedKV(VersionedBase):
             )
 
         # Orphan HAMT nodes: any keyset node not reachable from a live commit
-        keyset_prefix = Keyset.DEFAULT_PREFIX
-        for key in self.store.keys():
-            if not (isinstance(key, str) and key.startswith(keyset_prefix)):
-                continue
+        for key in node_keys:
             node_hash = key[len(keyset_prefix) :]
             if node_hash and node_hash not in reachable_nodes:
                 all_removals.append(key)
 
         # Orphan chunks: any chunk not reachable from a live commit
         # (or a young orphan, see above) is fair game.
-        for key in self.store.keys():
-            if not (isinstance(key, str) and key.startswith(CHUNK_PREFIX)):
-                continue
+        for key in chunk_keys:
             chunk_hash = key[len(CHUNK_PREFIX) :]
             if chunk_hash and chunk_hash not in reachable_chunks:
                 all_removals.append(key)
@@ -888,6 +1111,10 @@ class VersionedKV(VersionedBase):
         if all_removals:
             self.store.remove_many(*all_removals)
 
+        for orphan_hash in orphans:
+            self._parents_cache.pop(orphan_hash, None)
+            self._keyset_cache.pop(orphan_hash, None)
+
         if orphans:
             gc_logger.debug("Cleaned %d orphaned commit(s)", len(orphans))
 
@@ -1,7 +1,7 @@
 """Shared three-way merge resolution."""
 
 from dataclasses import dataclass
-from typing import Callable
+from typing import Callable, Mapping
 
 from ..errors import MergeConflict
 from .protocol import BytesMergeFn, DiffResult
@@ -10,6 +10,9 @@ from .protocol import BytesMergeFn, DiffResult
 BlobReader = Callable[[str], bytes | None]
 """Read a blob by its content identifier (versioned key or hex SHA)."""
 
+BlobsReader = Callable[[list[str]], Mapping[str, bytes]]
+"""Read many blobs at once; missing identifiers are omitted from the result."""
+
 
 @dataclass
 class MergeResolution:
@@ -32,8 +35,9 @@ def resolve_merge(
     our_diff: DiffResult,
     their_diff: DiffResult,
     blob_reader: BlobReader,
-    merge_fns: dict[str, BytesMergeFn],
+    merge_fns: Mapping[str, BytesMergeFn],
     default_merge: BytesMergeFn | None,
+    blobs_reader: BlobsReader | None = None,
 ) -> MergeResolution:
     """Resolve a three-way merge between two diverged keysets.
 
@@ -49,6 +53,9 @@ def resolve_merge(
         blob_reader: Callable to read blob bytes by content ID.
         merge_fns: Per-key merge functions.
         default_merge: Fallback merge function for unregistered keys.
+        blobs_reader: Optional batched reader. When given, every blob
+            the merge functions need is fetched in one call instead of
+            up to three ``blob_reader`` calls per contested key.
 
     Returns:
         MergeResolution with the merged keyset, values that need
@@ -68,7 +75,7 @@ def resolve_merge(
     merge_errors: dict[str, Exception] = {}
 
     # Unchanged keys: carry from their keyset (HEAD)
-    all_keys = set(our_keyset.keys()) | set(their_keyset.keys())
+    all_keys = our_keyset.keys() | their_keyset.keys()
     for key in all_keys - all_changed:
         if key in their_keyset:
             merged_keyset[key] = their_keyset[key]
@@ -88,6 +95,7 @@ def resolve_merge(
 
     # Contested: changed by both sides
     contested = our_changed & their_changed
+    to_merge: list[tuple[str, BytesMergeFn, bool, bool]] = []
     for key in contested:
         our_removed = key in our_diff.removed
         their_removed = key in their_diff.removed
@@ -109,10 +117,27 @@ def resolve_merge(
         if fn is None:
             conflicts.add(key)
             continue
-
-        old_val = blob_reader(lca_keyset[key]) if key in lca_keyset else None
-        our_val = None if our_removed else blob_reader(our_keyset[key])
-        their_val = None if their_removed else blob_reader(their_keyset[key])
+        to_merge.append((key, fn, our_removed, their_removed))
+
+    # Fetch every blob the merge functions need up front
+    wanted: list[str] = []
+    for key, _, our_removed, their_removed in to_merge:
+        if key in lca_keyset:
+            wanted.append(lca_keyset[key])
+        if not our_removed:
+            wanted.append(our_keyset[key])
+        if not their_removed:
+            wanted.append(their_keyset[key])
+    read: BlobReader
+    if blobs_reader is not None and wanted:
+        read = blobs_reader(wanted).get
+    else:
+        read = blob_reader
+
+    for key, fn, our_removed, their_removed in to_merge:
+        old_val = read(lca_keyset[key]) if key in lca_keyset else None
+        our_val = None if our_removed else read(our_keyset[key])
+        their_val = None if their_removed else read(their_keyset[key])
         try:
             result_val = fn(old_val, our_val, their_val)
             merged_values[key] = result_val
@@ -1,7 +1,7 @@
 """Versioned protocol and types."""
 
 from dataclasses import dataclass
-from typing import Callable, Iterable, Protocol, runtime_checkable
+from typing import Callable, Iterable, Mapping, Protocol, runtime_checkable
 
 
 BytesMergeFn = Callable[[bytes | None, bytes | None, bytes | None], bytes]
@@ -82,7 +82,7 @@ class Versioned(Protocol):
         removals: set[str] | None = None,
         *,
         on_conflict: str = "raise",
-        merge_fns: dict[str, BytesMergeFn] | None = None,
+        merge_fns: Mapping[str, BytesMergeFn] | None = None,
         default_merge: BytesMergeFn | None = None,
         info: dict | None = None,
         chunks: dict[str, bytes] | None = None,
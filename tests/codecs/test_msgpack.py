@@ -0,0 +1,55 @@
+"""Tests for the msgspec-backed ``msgpack`` codec preset."""
+
+from __future__ import annotations
+
+import pytest
+
+msgspec = pytest.importorskip("msgspec")
+
+import kvgit
+from kvgit import Staged, VersionedKV
+from kvgit.codecs import msgpack
+from kvgit.kv.memory import Memory
+
+
+class TestMsgpackFactory:
+    def test_pair_is_plain(self):
+        s = kvgit.store(codecs="msgpack")
+        assert s._encoder_chunked is False
+        assert s._decoder_chunked is False
+
+    def test_round_trips_json_like_values(self):
+        encoder, decoder = msgpack()
+        value = {"a": [1, 2.5, None], "b": "é", "c": b"\x00\x01", "d": True}
+        assert decoder(encoder(value)) == value
+
+    def test_tuples_come_back_as_lists(self):
+        encoder, decoder = msgpack()
+        assert decoder(encoder((1, 2))) == [1, 2]
+
+
+class TestStoreCodecsArg:
+    def test_preset_round_trips_through_commit(self):
+        s = kvgit.store(codecs="msgpack")
+        s["x"] = {"hits": 3, "tags": ["a", "b"]}
+        s.commit()
+        s.reset()
+        s._cache.clear()
+        assert s["x"] == {"hits": 3, "tags": ["a", "b"]}
+        assert msgspec.msgpack.decode(s.versioned.get("x")) == s["x"]
+
+    def test_merge_output_is_msgpack(self):
+        store = Memory()
+        encoder, decoder = msgpack()
+        s1 = Staged(VersionedKV(store), encoder=encoder, decoder=decoder)
+        s1["hits"] = 10
+        s1.commit()
+
+        s2 = Staged(VersionedKV(store), encoder=encoder, decoder=decoder)
+        s2.set_merge_fn("hits", kvgit.counter())
+        s1["hits"] = 15
+        s1.commit()
+        s2["hits"] = 20
+        assert s2.commit()
+        s2._cache.clear()
+        assert s2["hits"] == 25
@@ -63,6 +63,28 @@ class TestV2StoreOpenedByV3Code:
         s2.commit()
         assert safe_loads(store.get(STORAGE_VERSION_KEY)) == STORAGE_VERSION
 
+    def test_stamp_checked_once_per_instance(self):
+        store = Memory()
+        store.set(STORAGE_VERSION_KEY, dumps(2))
+        v = VersionedKV(store)
+
+        reads = 0
+        original = store.get
+
+        def counting(key):
+            nonlocal reads
+            if key == STORAGE_VERSION_KEY:
+                reads += 1
+            return original(key)
+
+        store.get = counting  # type: ignore[method-assign]
+        for i in range(3):
+            v.commit(
+                {f"k{i}": b"v"}, chunks={f"c{i}": b"x"}, chunk_refs={f"k{i}": [f"c{i}"]}
+            )
+        assert reads == 1
+        assert safe_loads(original(STORAGE_VERSION_KEY)) == STORAGE_VERSION
+
     def test_mixed_pickle_and_chunked_entries_coexist(self):
         encoder, decoder = chunked_pair()
         store = Memory()
@@ -95,6 +95,9 @@ class TestCompositeBasic:
         with pytest.raises(ValueError):
             Composite([])
 
+    def test_no_instance_dict(self):
+        assert not hasattr(Composite([Memory()]), "__dict__")
+
     def test_get_many_partial_hits_across_tiers(self):
         # "a" only in L2, "b" only in L1, "c" missing entirely.
         # Composite must collect a + b and skip c, populating L1 with a.
@@ -116,6 +119,45 @@ class TestCompositeBasic:
         result = c.get_many("a", "b")
         assert dict(result) == {"a": b"1", "b": b"2"}
 
+    def test_get_many_asks_lower_tiers_only_for_misses(self):
+        l1, l2 = Memory(), Memory()
+        l1.set("a", b"1")
+        l2.set_many(a=b"stale", b=b"2")
+        asked: list[list[str]] = []
+        original = l2.get_many
+
+        def recording(*args):
+            keys = list(l2._normalize_keys(args))
+            asked.append(keys)
+            return original(keys)
+
+        l2.get_many = recording  # type: ignore[method-assign]
+        c = Composite([l1, l2])
+        result = c.get_many(k for k in ("a", "b", "a"))
+        assert dict(result) == {"a": b"1", "b": b"2"}
+        assert asked == [["b"]]
+
+    def test_get_many_backfills_each_tier_once(self):
+        # "a" is found in L2 and "b" in L3: L1 gets both in one write,
+        # L2 gets only what was found below it.
+        l1, l2, l3 = Memory(), Memory(), Memory()
+        l2.set("a", b"1")
+        l3.set("b", b"2")
+        writes: dict[str, list[dict[str, bytes]]] = {"l1": [], "l2": []}
+        for name, tier in (("l1", l1), ("l2", l2)):
+            original = tier.set_many
+
+            def recording(*args, _log=writes[name], _orig=original, **kwargs):
+                _log.append(dict(*args, **kwargs))
+                _orig(*args, **kwargs)
+
+            tier.set_many = recording  # type: ignore[method-assign]
+        c = Composite([l1, l2, l3])
+        assert dict(c.get_many("a", "b")) == {"a": b"1", "b": b"2"}
+        assert writes["l1"] == [{"a": b"1", "b": b"2"}]
+        assert writes["l2"] == [{"b": b"2"}]
+        assert l1.get_many("a", "b") == {"a": b"1", "b": b"2"}
+
 
 class TestCompositeRemove:
     def test_remove_all_tiers(self):
@@ -95,6 +95,17 @@ class TestDiskCAS:
         assert not store.cas("k", b"new", expected=b"wrong")
         assert store.get("k") == b"old"
 
+    def test_set_many_and_cas(self, disk_store):
+        store, _ = disk_store
+        store.set("head", b"old")
+        assert store.set_many_and_cas({"prev": b"old"}, "head", b"new", b"old")
+        assert not store.set_many_and_cas({"x": b"1"}, "head", b"newer", b"old")
+        assert store.get_many("prev", "head", "x") == {
+            "prev": b"old",
+            "head": b"new",
+            "x": b"1",
+        }
+
 
 class TestDiskBulkCallForms:
     """Disk backend supports both variadic and container call forms."""
@@ -152,3 +163,30 @@ class TestDiskSizeLimit:
             store = Disk(d, size_limit=10 * 1024 * 1024)  # 10 MiB
             store.set("k", b"v")
             assert store.get("k") == b"v"
+
+    def test_unbounded_store_disables_eviction(self):
+        with tempfile.TemporaryDirectory() as d:
+            store = Disk(d)
+            assert store.store.eviction_policy == "none"
+
+    def test_reopen_with_cap_evicts_after_unbounded_open(self):
+        # diskcache persists eviction_policy; an earlier unbounded open
+        # saves "none", which must not survive a reopen with a cap.
+        with tempfile.TemporaryDirectory() as d:
+            Disk(d).store.close()
+            store = Disk(d, size_limit=10_000)
+            assert store.store.eviction_policy == "least-recently-stored"
+            for i in range(200):
+                store.set(f"k{i}", b"v" * 1000)
+            assert len(store.store) < 200
+
+    def test_eviction_policy_passthrough(self):
+        with tempfile.TemporaryDirectory() as d:
+            store = Disk(
+                d,
+                size_limit=10 * 1024 * 1024,
+                eviction_policy="least-frequently-used",
+            )
+            assert store.store.eviction_policy == "least-frequently-used"
+            store.set("k", b"v")
+            assert store.get("k") == b"v"
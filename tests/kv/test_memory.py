@@ -33,6 +33,20 @@ class TestMemoryBasic:
         m.set("b", b"2")
         assert dict(m.items()) == {"a": b"1", "b": b"2"}
 
+    def test_items_skips_keys_removed_mid_iteration(self):
+        m = Memory()
+        m.set_many(a=b"1", b=b"2")
+        it = iter(m.items())
+        first, _ = next(it)
+        m.remove("b" if first == "a" else "a")
+        assert list(it) == []
+
+    def test_keys_with_prefix(self):
+        m = Memory()
+        m.set_many(**{"app/a": b"1", "app/b": b"2", "other/c": b"3"})
+        assert set(m.keys_with_prefix("app/")) == {"app/a", "app/b"}
+        assert list(m.keys_with_prefix("missing/")) == []
+
     def test_set_many_get_many(self):
         m = Memory()
         m.set_many(a=b"1", b=b"2", c=b"3")
@@ -181,6 +195,20 @@ class TestMemoryCAS:
         assert not m.cas("k", b"new", expected=None)
         assert m.get("k") == b"existing"
 
+    def test_cas_mismatch_skips_lock(self):
+        class _NoLock:
+            def __enter__(self):
+                raise AssertionError("lock taken for a failing CAS")
+
+            def __exit__(self, *exc):
+                return False
+
+        m = Memory()
+        m.set("k", b"old")
+        m._lock = _NoLock()  # type: ignore[assignment]
+        assert not m.cas("k", b"new", expected=b"wrong")
+        assert not m.cas("k", b"new", expected=None)
+
     def test_cas_thread_safety(self):
         m = Memory()
         m.set("counter", b"0")
@@ -197,3 +225,50 @@ class TestMemoryCAS:
             t.join()
 
         assert len(wins) == 1
+
+    def test_set_many_and_cas_success(self):
+        m = Memory()
+        m.set("head", b"old")
+        assert m.set_many_and_cas({"prev": b"old"}, "head", b"new", b"old")
+        assert m.get_many("prev", "head") == {"prev": b"old", "head": b"new"}
+
+    def test_set_many_and_cas_failure_keeps_writes(self):
+        m = Memory()
+        m.set("head", b"theirs")
+        assert not m.set_many_and_cas({"prev": b"old"}, "head", b"new", b"old")
+        assert m.get_many("prev", "head") == {"prev": b"old", "head": b"theirs"}
+
+
+class TestMemoryOptimisticReads:
+    def test_get_many_accepts_generator(self):
+        m = Memory()
+        m.set_many(a=b"1", b=b"2")
+        assert m.get_many(k for k in ("a", "b")) == {"a": b"1", "b": b"2"}
+
+    def test_get_many_never_sees_partial_set_many(self):
+        m = Memory()
+        m.set_many(a=b"0", b=b"0")
+        stop = threading.Event()
+        torn = []
+
+        def writer():
+            i = 0
+            while not stop.is_set():
+                i += 1
+                v = str(i).encode()
+                m.set_many(a=v, b=v)
+
+        def reader():
+            for _ in range(20000):
+                got = m.get_many("a", "b")
+                if got["a"] != got["b"]:
+                    torn.append(got)
+
+        w = threading.Thread(target=writer)
+        w.start()
+        try:
+            reader()
+        finally:
+            stop.set()
+            w.join()
+        assert torn == []
@@ -1,5 +1,7 @@
 """Tests for merge functions."""
 
+import pickle
+
 from kvgit import Staged, VersionedKV as Versioned, counter, last_writer_wins
 from kvgit.kv.memory import Memory
 
@@ -44,6 +46,26 @@ class TestMergeFnIntegration:
         assert s2.commit()
         assert s2.get("hits") == 25
 
+    def test_merge_result_uses_custom_encoder(self):
+        """A plain custom encoder also encodes the merge output."""
+        import json
+
+        def encode(v):
+            return json.dumps(v).encode()
+
+        store = Memory()
+        s1 = Staged(Versioned(store), encoder=encode, decoder=json.loads)
+        s1["hits"] = 10
+        s1.commit()
+
+        s2 = Staged(Versioned(store), encoder=encode, decoder=json.loads)
+        s2.set_merge_fn("hits", counter())
+        s1["hits"] = 15
+        s1.commit()
+        s2["hits"] = 20
+        assert s2.commit()
+        assert s2.versioned.get("hits") == b"25"
+
     def test_set_merge_fn_resolves_conflict(self):
         """set_merge_fn registers the merge function."""
         store = Memory()
@@ -63,6 +85,31 @@ class TestMergeFnIntegration:
         assert s2.commit()
         assert s2.get("x") == 8  # 5 + 3 - 0
 
+    def test_only_consulted_merge_fns_are_wrapped(self, monkeypatch):
+        """Registered fns for keys that never conflict are not wrapped."""
+        store = Memory()
+
+        s1 = Staged(Versioned(store))
+        s1["x"] = 0
+        s1.commit()
+
+        s2 = Staged(Versioned(store))
+        for i in range(100):
+            s2.set_merge_fn(f"unused{i}", counter())
+        s2.set_merge_fn("x", counter())
+        wrapped = []
+        wrap = s2._wrap_merge_fn
+        monkeypatch.setattr(
+            s2, "_wrap_merge_fn", lambda fn: wrapped.append(fn) or wrap(fn)
+        )
+
+        s1["x"] = 5
+        s1.commit()
+        s2["x"] = 3
+        assert s2.commit(merge_fns={"y": counter()})
+        assert s2.get("x") == 8
+        assert len(wrapped) == 1
+
     def test_custom_merge_fn(self):
         """Custom merge function on decoded values."""
 
@@ -85,3 +132,27 @@ class TestMergeFnIntegration:
         s2["tags"] = ["a", "b", "d"]
         assert s2.commit()
         assert s2.get("tags") == ["a", "b", "c", "d"]
+
+    def test_last_writer_wins_merges_without_decoding(self):
+        """LWW keeps their encoded bytes; nothing is decoded to merge."""
+        decoded: list[bytes] = []
+
+        def decoder(raw: bytes):
+            decoded.append(raw)
+            return pickle.loads(raw)
+
+        store = Memory()
+        s1 = Staged(Versioned(store), decoder=decoder)
+        s1["x"] = {"v": 0}
+        s1.commit()
+
+        s2 = Staged(Versioned(store), decoder=decoder)
+        s2.set_default_merge(last_writer_wins())
+
+        s1["x"] = {"v": 1}
+        s1.commit()
+        s2["x"] = {"v": 2}
+        assert s2.commit()
+
+        assert decoded == []
+        assert s2.get("x") == {"v": 1}
@@ -0,0 +1,33 @@
+"""Tests for the JSON byte helpers."""
+
+import json
+import math
+
+from kvgit.encoding import dumps, loads, safe_loads
+
+
+class TestDumps:
+    def test_matches_stdlib_compact_form(self):
+        obj = {"b": [1, 2.5, None], "a": "é", "c": {"z": 1, "y": 2}}
+        assert dumps(obj) == json.dumps(obj, separators=(",", ":")).encode()
+
+    def test_sort_keys_matches_stdlib(self):
+        obj = {"b": 1, "a": {"d": 2, "c": 3}}
+        expected = json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
+        assert dumps(obj, sort_keys=True) == expected
+
+
+class TestLoads:
+    def test_round_trip(self):
+        obj = ["hash:key", {"size": 3, "created_at": 1.5, "chunks": ["a"]}]
+        assert loads(dumps(obj)) == obj
+
+    def test_accepts_stdlib_only_values(self):
+        # NaN and integers beyond 64 bits are valid stdlib JSON but are
+        # rejected by orjson; loads must still read them.
+        assert math.isnan(loads(dumps(float("nan"))))
+        assert loads(dumps(2**70)) == 2**70
+
+    def test_safe_loads_returns_none_on_garbage(self):
+        assert safe_loads(b"\x00not json") is None
+        assert safe_loads(b'"ok"') == "ok"
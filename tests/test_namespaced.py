@@ -52,6 +52,13 @@ class TestNamespacedBasic:
         result = ns.get_many("a", "b", "c")
         assert result == {"a": 1, "b": 2}
 
+    def test_get_many_nested(self):
+        s = _staged()
+        inner = Namespaced(Namespaced(s, "app"), "cfg")
+        inner["x"] = 1
+        s["app/x"] = 2
+        assert inner.get_many("x", "y") == {"x": 1}
+
 
 class TestNamespacedMutableMapping:
     def test_getitem(self):
@@ -87,6 +94,18 @@ class TestNamespacedMutableMapping:
         ns["b"] = 2
         assert len(ns) == 2
 
+    def test_iter_tolerates_writes(self):
+        s = _staged()
+        ns = Namespaced(s, "app")
+        ns["a"] = 1
+        ns["b"] = 2
+        s.commit()
+        for key in ns:
+            ns[key] = ns[key] * 10
+            ns[key + "x"] = 0
+        assert dict(ns.items()) == {"a": 10, "b": 20, "ax": 0, "bx": 0}
+        assert len(ns) == 4
+
 
 class TestNamespacedIsolation:
     def test_two_namespaces_isolated(self):
@@ -118,6 +137,38 @@ class TestNamespacedIsolation:
         descendants = set(ns.descendant_keys())
         assert descendants == {"a", "sub/b", "sub/deep/c"}
 
+    def test_no_instance_dict(self):
+        ns = Namespaced(_staged(), "app")
+        assert not hasattr(ns, "__dict__")
+
+    def test_keys_uses_prefix_scan(self):
+        s = _staged()
+        ns = Namespaced(s, "app")
+        ns["a"] = 1
+        s["other/b"] = 2
+        s.commit()
+        s.keys = lambda: pytest.fail("full key scan")
+        assert set(ns.keys()) == {"a"}
+        assert set(ns.descendant_keys()) == {"a"}
+
+    def test_keys_is_a_set_snapshot(self):
+        s = _staged()
+        ns = Namespaced(s, "app")
+        ns["a"] = 1
+        s["app/sub/a"] = 2  # nested, so not a direct child
+        keys = ns.keys()
+        assert isinstance(keys, set)
+        assert keys == {"a"}
+        ns["b"] = 3
+        assert "b" not in keys
+
+    def test_membership_needs_no_scan(self):
+        s = _staged()
+        ns = Namespaced(s, "app")
+        ns["a"] = 1
+        s.keys_with_prefix = lambda prefix: pytest.fail("prefix scan")
+        assert "a" in ns
+
 
 class TestNamespacedNested:
     def test_nested_namespace(self):
@@ -1,5 +1,7 @@
 """Tests for the Staged buffered-write layer."""
 
+import pickle
+
 import pytest
 
 from kvgit import MergeResult, Staged, VersionedKV as Versioned
@@ -52,6 +54,15 @@ class TestStagedMutableMapping:
         with pytest.raises(KeyError):
             s["nope"]
 
+    def test_getitem_stored_none(self):
+        s = Staged(Versioned())
+        s["k"] = None
+        s.commit()
+        assert s["k"] is None
+        del s["k"]
+        with pytest.raises(KeyError):
+            s["k"]
+
     def test_setitem(self):
         s = Staged(Versioned())
         s["k"] = "v"
@@ -74,6 +85,18 @@ class TestStagedMutableMapping:
         s["b"] = 2
         assert set(s) == {"a", "b"}
 
+    def test_keys_with_prefix(self):
+        s = Staged(Versioned())
+        s["app/a"] = 1
+        s["app/b"] = 2
+        s["other/c"] = 3
+        s.commit()
+        s["app/b"] = 20  # staged update shadows committed key
+        s["app/d"] = 4
+        del s["app/a"]
+        keys = list(s.keys_with_prefix("app/"))
+        assert sorted(keys) == ["app/b", "app/d"]
+
     def test_len(self):
         s = Staged(Versioned())
         assert len(s) == 0
@@ -89,6 +112,40 @@ class TestStagedMutableMapping:
         s["c"] = 3
         assert len(s) == 3
 
+    def test_len_with_mixed_staged_changes(self):
+        s = Staged(Versioned())
+        s.update(a=1, b=2, c=3)
+        s.commit()
+        s["b"] = 20  # shadows a committed key
+        s["d"] = 4
+        s["e"] = 5
+        del s["a"]
+        del s["e"]  # staged-only key removed again
+        assert len(s) == 3 == len(list(s))
+
+    def test_keys_is_a_set_snapshot(self):
+        s = Staged(Versioned())
+        s["a"] = 1
+        s["b"] = 2
+        s.commit()
+        del s["b"]
+        s["c"] = 3
+        keys = s.keys()
+        assert isinstance(keys, set)
+        assert keys == {"a", "c"}
+        s["d"] = 4
+        assert "d" not in keys
+
+    def test_iteration_tolerates_writes(self):
+        s = Staged(Versioned())
+        s.update(a=1, b=2)
+        s.commit()
+        s["c"] = 3
+        for key in s:
+            s[key + "2"] = 0
+            del s[key]
+        assert sorted(s) == ["a2", "b2", "c2"]
+
 
 class TestStagedRemove:
     def test_remove_shadows_committed(self):
@@ -115,6 +172,25 @@ class TestStagedRemove:
         del s["a"]
         assert set(s.keys()) == {"b"}
 
+    def test_remove_uncommitted_key_leaves_nothing_staged(self):
+        s = Staged(Versioned())
+        s["k"] = "v"
+        del s["k"]
+        assert not s.has_changes
+        assert "k" not in s
+        with pytest.raises(KeyError):
+            del s["k"]
+
+    def test_remove_overwritten_committed_key_stages_removal(self):
+        s = Staged(Versioned())
+        s["k"] = "v1"
+        s.commit()
+        s["k"] = "v2"
+        del s["k"]
+        assert s.is_staged("k")
+        s.commit()
+        assert "k" not in s.versioned
+
     def test_set_after_remove(self):
         s = Staged(Versioned())
         s["k"] = "v1"
@@ -139,6 +215,15 @@ class TestStagedCommit:
         assert s2.get("a") == 1
         assert s2.get("b") == 2
 
+    def test_default_encoder_uses_highest_pickle_protocol(self):
+        v = Versioned()
+        s = Staged(v)
+        s["a"] = b"payload"
+        s.commit()
+        raw = v.get("a")
+        assert raw is not None
+        assert raw[:2] == bytes([0x80, pickle.HIGHEST_PROTOCOL])
+
     def test_commit_clears_staging(self):
         s = Staged(Versioned())
         s["a"] = 1
@@ -504,6 +589,68 @@ class TestStagedRefresh:
         assert not s.has_changes
 
 
+class TestStagedReadCache:
+    def test_cache_is_bounded_lru(self):
+        s = Staged(Versioned(), cache_size=2)
+        for k in ("a", "b", "c"):
+            s[k] = k
+        s.commit()
+        s.get("a")
+        s.get("b")
+        s.get("a")  # refresh "a" so "b" is the oldest
+        s.get("c")
+        assert list(s._cache) == ["a", "c"]
+
+    def test_get_many_respects_bound(self):
+        s = Staged(Versioned(), cache_size=2)
+        s.update({"a": 1, "b": 2, "c": 3})
+        s.commit()
+        assert s.get_many("a", "b", "c") == {"a": 1, "b": 2, "c": 3}
+        assert len(s._cache) == 2
+
+    def test_contains_answers_from_cache(self, monkeypatch):
+        s = Staged(Versioned())
+        s["a"] = 1
+        s.commit()
+        assert s["a"] == 1
+
+        def fail(self, key):
+            raise AssertionError("backend membership check")
+
+        monkeypatch.setattr(Versioned, "__contains__", fail)
+        assert "a" in s
+
+    def test_fast_forward_commit_keeps_untouched_entries(self):
+        s = Staged(Versioned())
+        s.update({"a": 1, "b": 2, "c": 3})
+        s.commit()
+        s.get_many("a", "b", "c")
+        s["a"] = 10
+        del s["b"]
+        assert s.commit().strategy == "fast_forward"
+        assert list(s._cache) == ["c"]
+        assert s["a"] == 10
+        assert "b" not in s
+
+    def test_zero_disables_cache(self):
+        s = Staged(Versioned(), cache_size=0)
+        s["a"] = 1
+        s.commit()
+        assert s["a"] == 1
+        assert not s._cache
+
+    def test_negative_size_rejected(self):
+        with pytest.raises(ValueError, match="cache_size"):
+            Staged(Versioned(), cache_size=-1)
+
+    def test_branch_inherits_cache_size(self):
+        s = Staged(Versioned(), cache_size=7)
+        s["k"] = "v"
+        s.commit()
+        assert s.create_branch("worker")._cache_size == 7
+        assert s.checkout(s.current_commit)._cache_size == 7
+
+
 class TestStagedEncoder:
     def test_custom_encoder_decoder(self):
         import json
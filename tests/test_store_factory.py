@@ -1,11 +1,12 @@
 """Tests for the kvgit.store() factory function."""
 
 import os
+import sys
 import tempfile
 
 import pytest
 
-from kvgit import Staged, store
+from kvgit import Staged, codecs, store
 
 
 class TestStoreFactory:
@@ -21,6 +22,22 @@ class TestStoreFactory:
         with pytest.raises(ValueError, match="path is required"):
             store(kind="disk")
 
+    def test_msgpack_preset_names_missing_extra(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+        monkeypatch.setitem(sys.modules, "msgspec.msgpack", None)
+        with pytest.raises(ImportError, match=r"kvgit\[msgpack\]"):
+            store(codecs="msgpack")
+
+    def test_msgpack_codec_names_missing_extra(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+        monkeypatch.setitem(sys.modules, "msgspec.msgpack", None)
+        with pytest.raises(ImportError, match=r"kvgit\[msgpack\]"):
+            codecs.msgpack()
+
+    def test_unknown_preset_lists_msgpack(self):
+        with pytest.raises(ValueError, match="'msgpack'"):
+            store(codecs="bogus")
+
     def test_branch_parameter(self):
         s = store(branch="dev")
         assert isinstance(s, Staged)
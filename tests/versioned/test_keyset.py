@@ -51,6 +51,12 @@ def test_keyset_entry_is_frozen():
         e.blob = "different"  # type: ignore[misc]
 
 
+def test_entries_are_slotted():
+    e = _entry()
+    assert not hasattr(e, "__dict__")
+    assert not hasattr(e.meta, "__dict__")
+
+
 # ---- empty keyset ----
 
 